@@ -0,0 +1,48 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+
+def get_user_cache():
+    return caches[settings.AUTH_USER_CACHE_ALIAS]
+
+
+def get_user_version_key(user_id):
+    return f'auth-user:{user_id}:version'
+
+
+def bump_user_version(user_id):
+    key = get_user_version_key(user_id)
+    try:
+        get_user_cache().incr(key)
+    except ValueError:
+        get_user_cache().set(key, time.time_ns(), None)
+
+
+def invalidate_cached_user(user_id):
+    bump_user_version(user_id)
+    transaction.on_commit(lambda: bump_user_version(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+        cache = get_user_cache()
+        version = cache.get_or_set(
+            get_user_version_key(user_id), time.time_ns, None
+        )
+        key = f'auth-user:{user_id}'
+        user = cache.get(key, version=version)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(
+                key, user, settings.AUTH_USER_CACHE_TIMEOUT, version=version
+            )
+        return user
@@ -0,0 +1,45 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+CATALOG_VERSION_KEY = 'catalog:version'
+
+
+def get_detail_cache():
+    return caches[settings.DETAIL_CACHE_ALIAS]
+
+
+def get_detail_cache_key(model, pk):
+    return f'detail:{model._meta.label_lower}:{pk}'
+
+
+def invalidate_detail_cache(model, pks):
+    keys = [get_detail_cache_key(model, pk) for pk in pks if pk is not None]
+    if not keys:
+        return
+    get_detail_cache().delete_many(keys)
+    transaction.on_commit(lambda: get_detail_cache().delete_many(keys))
+
+
+def get_catalog_cache():
+    return caches[settings.LIST_CACHE_ALIAS]
+
+
+def get_catalog_version():
+    return get_catalog_cache().get_or_set(
+        CATALOG_VERSION_KEY, time.time_ns, None
+    )
+
+
+def bump_catalog_version():
+    try:
+        get_catalog_cache().incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        get_catalog_cache().set(CATALOG_VERSION_KEY, time.time_ns(), None)
+
+
+def invalidate_catalog():
+    bump_catalog_version()
+    transaction.on_commit(bump_catalog_version)
@@ -1,22 +1,26 @@
 import django_filters
 
-from reviews.models import Title
+from reviews.models import Title, TitleGenre
+from reviews.search import search_titles
+
+
+class CharInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    pass
 
 
 class TitlesFilter(django_filters.FilterSet):
-    category = django_filters.CharFilter(
-        field_name='category__slug',
-        lookup_expr='icontains'
-    )
-    genre = django_filters.CharFilter(
-        field_name='genre__slug',
-        lookup_expr='icontains'
-    )
-    name = django_filters.CharFilter(
-        field_name='name',
-        lookup_expr='icontains'
-    )
+    category = django_filters.CharFilter(field_name='category__slug')
+    genre = CharInFilter(method='filter_genre')
+    name = django_filters.CharFilter(method='filter_name')
 
     class Meta:
         model = Title
         fields = ('category', 'genre', 'name', 'year',)
+
+    def filter_genre(self, queryset, name, value):
+        return queryset.filter(pk__in=TitleGenre.objects.filter(
+            genre__slug__in=value
+        ).values('title_id'))
+
+    def filter_name(self, queryset, name, value):
+        return search_titles(queryset, value)
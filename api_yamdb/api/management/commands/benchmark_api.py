@@ -0,0 +1,355 @@
+import json
+import logging
+import os
+import time
+import tracemalloc
+import warnings
+from functools import partial
+from io import StringIO
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import (CaptureQueriesContext, setup_test_environment,
+                               teardown_test_environment)
+from django.urls import URLResolver, reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.urls import urlpatterns
+from reviews.models import ADMIN, Category, Comment, Genre, User
+
+BUDGETS_PATH = os.path.join(
+    settings.BASE_DIR, 'api', 'benchmark_budgets.json'
+)
+METRICS = ('p50_ms', 'p99_ms', 'queries', 'peak_kb')
+MEMORY_REQUESTS = 3
+CACHE_MODES = ('cold', 'warm')
+HTTP_METHODS = ('get', 'post', 'put', 'patch', 'delete')
+EXCLUDED_METHODS = {
+    'put': 'обрабатывается так же, как замеряемый PATCH',
+    'delete': 'объект удаляется первым запросом, остальные замеряли бы '
+              'ответ 404',
+}
+EXCLUDED_ROUTES = {
+    ('reviews-list', 'post'): 'автор оставляет один отзыв на произведение, '
+                              'остальные запросы замеряли бы ответ 400',
+}
+
+
+def clear_caches():
+    for cache in caches.all():
+        cache.clear()
+
+
+def iter_patterns(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_patterns(pattern.url_patterns)
+        elif 'format' not in pattern.pattern.regex.groupindex:
+            yield pattern
+
+
+def get_methods(pattern):
+    actions = getattr(pattern.callback, 'actions', None)
+    if actions is not None:
+        return list(actions)
+    view_class = pattern.callback.view_class
+    return [method for method in HTTP_METHODS if hasattr(view_class, method)]
+
+
+def get_excluded_reason(name, method):
+    return EXCLUDED_ROUTES.get((name, method), EXCLUDED_METHODS.get(method))
+
+
+def percentile(values, share):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * share))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Замеряет задержку, число SQL-запросов и пик памяти для каждого '
+        'маршрута API на сгенерированных данных разного объёма.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            default='1000,10000',
+            help='Количество отзывов в наборах данных через запятую.'
+        )
+        parser.add_argument('--requests', type=int, default=50)
+        parser.add_argument('--output', default='benchmark_results.json')
+        parser.add_argument('--budgets', default=BUDGETS_PATH)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--current-db',
+            action='store_true',
+            help='Использовать текущую базу данных вместо тестовой. '
+                 'Все данные в ней будут удалены.'
+        )
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',')]
+        self.excluded = {}
+        try:
+            setup_test_environment()
+            test_environment = True
+        except RuntimeError:
+            test_environment = False
+        logging.disable(logging.CRITICAL)
+        old_name = None
+        if not options['current_db']:
+            old_name = connection.settings_dict['NAME']
+            connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                results = [
+                    result for size in sizes
+                    for result in self.run_size(size, options)
+                ]
+        finally:
+            if old_name is not None:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+            logging.disable(logging.NOTSET)
+            if test_environment:
+                teardown_test_environment()
+        excluded = [
+            {'endpoint': name, 'method': method.upper(), 'reason': reason}
+            for (name, method), reason in self.excluded.items()
+        ]
+        for route in excluded:
+            self.stdout.write(
+                f'Не замеряется {route["method"]} {route["endpoint"]}: '
+                f'{route["reason"]}'
+            )
+        with open(options['output'], 'w', encoding='utf-8') as file:
+            json.dump(
+                {'sizes': sizes, 'results': results, 'excluded': excluded},
+                file, indent=2, ensure_ascii=False
+            )
+        self.stdout.write(f'Результаты сохранены в {options["output"]}')
+        self.check_budgets(results, options['budgets'])
+
+    def prepare(self, size, seed):
+        call_command('flush', interactive=False, verbosity=0)
+        clear_caches()
+        call_command(
+            'generate_data',
+            '--users', str(max(50, size // 20)),
+            '--titles', str(max(10, size // 10)),
+            '--genres', '30',
+            '--categories', '10',
+            '--reviews', str(size),
+            '--comments', str(size // 2),
+            '--seed', str(seed),
+            stdout=StringIO()
+        )
+        admin = User.objects.create(
+            username='benchmark', email='benchmark@yamdb.fake', role=ADMIN
+        )
+        client = APIClient()
+        client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(admin)}'
+        )
+        hot = Comment.objects.values('review_id', 'review__title_id').annotate(
+            comments=Count('pk')
+        ).order_by('-comments').first()
+        comment = Comment.objects.filter(review_id=hot['review_id']).first()
+        return client, {
+            'title_id': hot['review__title_id'],
+            'review_id': hot['review_id'],
+            'username': admin.username,
+            'table': 'titles',
+            'slug': {
+                'category': Category.objects.order_by('pk').first().slug,
+                'genre': Genre.objects.order_by('pk').first().slug,
+            },
+            'pk': {
+                'titles': hot['review__title_id'],
+                'reviews': hot['review_id'],
+                'comments': comment.pk,
+            },
+        }
+
+    def get_routes(self, samples):
+        routes = []
+        for pattern in iter_patterns(urlpatterns):
+            kwargs = {}
+            for name in pattern.pattern.regex.groupindex:
+                value = samples[name]
+                if isinstance(value, dict):
+                    value = value[pattern.name.rsplit('-', 1)[0]]
+                kwargs[name] = value
+            url = reverse(pattern.name, kwargs=kwargs)
+            for method in get_methods(pattern):
+                reason = get_excluded_reason(pattern.name, method)
+                if reason:
+                    self.excluded[(pattern.name, method)] = reason
+                else:
+                    routes.append((pattern.name, method, url))
+        return sorted(routes, key=lambda route: route[1] != 'get')
+
+    def payload(self, name, method, index, samples):
+        build = getattr(
+            self, f'payload_{name.replace("-", "_")}_{method}', None
+        )
+        return None if build is None else build(index, samples)
+
+    def payload_signup_post(self, index, samples):
+        return {
+            'username': f'signup{index}',
+            'email': f'signup{index}@yamdb.fake',
+        }
+
+    def payload_token_post(self, index, samples):
+        return {
+            'username': samples['username'],
+            'confirmation_code': 'invalid',
+        }
+
+    def payload_category_list_post(self, index, samples):
+        return {'name': f'Категория {index}', 'slug': f'benchmark-{index}'}
+
+    def payload_genre_list_post(self, index, samples):
+        return {'name': f'Жанр {index}', 'slug': f'benchmark-{index}'}
+
+    def payload_titles_list_post(self, index, samples):
+        return {
+            'name': f'Произведение {index}',
+            'year': 2000,
+            'category': samples['slug']['category'],
+            'genre': [samples['slug']['genre']],
+        }
+
+    def payload_titles_bulk_post(self, index, samples):
+        return [self.payload_titles_list_post(index, samples)]
+
+    def payload_titles_detail_patch(self, index, samples):
+        return {'name': f'Произведение {index}'}
+
+    def payload_user_list_post(self, index, samples):
+        return {
+            'username': f'benchmark{index}',
+            'email': f'benchmark{index}@yamdb.fake',
+        }
+
+    def payload_user_me_patch(self, index, samples):
+        return {'bio': f'О себе {index}'}
+
+    def payload_user_detail_patch(self, index, samples):
+        return {'bio': f'О себе {index}'}
+
+    def payload_reviews_detail_patch(self, index, samples):
+        return {'text': f'Отзыв {index}'}
+
+    def payload_comments_list_post(self, index, samples):
+        return {'text': f'Комментарий {index}'}
+
+    def payload_comments_detail_patch(self, index, samples):
+        return {'text': f'Комментарий {index}'}
+
+    def run_size(self, size, options):
+        client, samples = self.prepare(size, options['seed'])
+        for name, method, url in self.get_routes(samples):
+            request = getattr(client, method)
+            if method != 'get':
+                request = partial(request, format='json')
+            for offset, mode in enumerate(CACHE_MODES):
+                result = {
+                    'size': size,
+                    'endpoint': name,
+                    'cache': mode,
+                    'method': method.upper(),
+                    'url': url,
+                    'requests': options['requests'],
+                    **self.measure(
+                        request, url, name, method, samples, options,
+                        mode == 'cold',
+                        offset * (options['requests'] + MEMORY_REQUESTS + 1)
+                    ),
+                }
+                self.stdout.write(
+                    f'{size:>9} {method.upper():<4} {name:<16} {mode:<4} '
+                    f'p50 {result["p50_ms"]:>8.2f} ms  '
+                    f'p99 {result["p99_ms"]:>8.2f} ms  '
+                    f'запросов {result["queries"]:>3}  '
+                    f'память {result["peak_kb"]:>8.1f} KiB'
+                )
+                yield result
+
+    def request(self, request, url, data):
+        response = request(url, data=data)
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response
+
+    def send(self, request, url, data, cold):
+        if cold:
+            clear_caches()
+        return self.request(request, url, data)
+
+    def measure(self, request, url, name, method, samples, options, cold,
+                offset):
+        self.send(
+            request, url, self.payload(name, method, offset, samples), cold
+        )
+        timings = []
+        queries = []
+        for index in range(offset + 1, offset + 1 + options['requests']):
+            data = self.payload(name, method, index, samples)
+            if cold:
+                clear_caches()
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                response = self.request(request, url, data)
+                timings.append((time.perf_counter() - start) * 1000)
+            queries.append(len(context.captured_queries))
+        tracemalloc.start()
+        for index in range(MEMORY_REQUESTS):
+            self.send(request, url, self.payload(
+                name, method, offset + 1 + options['requests'] + index,
+                samples
+            ), cold)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {
+            'status': response.status_code,
+            'p50_ms': round(percentile(timings, 0.5), 3),
+            'p99_ms': round(percentile(timings, 0.99), 3),
+            'queries': max(queries),
+            'peak_kb': round(peak / 1024, 1),
+        }
+
+    def check_budgets(self, results, path):
+        if not path or not os.path.exists(path):
+            return
+        with open(path, encoding='utf-8') as file:
+            budgets = json.load(file)
+        default = budgets.get('*', {})
+        violations = []
+        for result in results:
+            budget = {
+                **default,
+                **budgets.get(result['endpoint'], {}),
+                **budgets.get(
+                    f'{result["method"]} {result["endpoint"]}', {}
+                ),
+            }
+            for metric in METRICS:
+                if metric in budget and result[metric] > budget[metric]:
+                    violations.append(
+                        f'{result["endpoint"]} ({result["size"]}, '
+                        f'{result["cache"]}): '
+                        f'{metric} {result[metric]} > {budget[metric]}'
+                    )
+        if violations:
+            raise CommandError(
+                'Превышены бюджеты:\n' + '\n'.join(violations)
+            )
+        self.stdout.write(self.style.SUCCESS('Бюджеты соблюдены'))
@@ -0,0 +1,63 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from api.serializers import (CommentFastSerializer, CommentSerializer,
+                             ReviewFastSerializer, ReviewSerializer,
+                             TitleReadFastSerializer, TitleReadSerializer)
+from reviews.models import Comment, Review, Title
+
+CASES = (
+    ('titles', TitleReadSerializer, TitleReadFastSerializer,
+     Title.objects.select_related('category').prefetch_related('genre')),
+    ('reviews', ReviewSerializer, ReviewFastSerializer,
+     Review.objects.select_related('author')),
+    ('comments', CommentSerializer, CommentFastSerializer,
+     Comment.objects.select_related('author')),
+)
+
+
+def measure(serializer_class, objects, repeat):
+    renderer = JSONRenderer()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        content = renderer.render(serializer_class(objects, many=True).data)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), content
+
+
+class Command(BaseCommand):
+    help = (
+        'Сравнивает время сериализации страниц произведений, отзывов '
+        'и комментариев через DRF и через быстрые сериализаторы.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        for name, serializer_class, fast_class, queryset in CASES:
+            objects = list(queryset[:options['size']])
+            if not objects:
+                raise CommandError(
+                    'Нет данных для замеров, выполните generate_data.'
+                )
+            drf_ms, drf_content = measure(
+                serializer_class, objects, options['repeat']
+            )
+            fast_ms, fast_content = measure(
+                fast_class, objects, options['repeat']
+            )
+            if fast_content != drf_content:
+                raise CommandError(
+                    f'{name}: быстрый сериализатор дал другой JSON.'
+                )
+            self.stdout.write(
+                f'{name} ({len(objects)}): DRF {drf_ms:.2f} ms, '
+                f'быстрый {fast_ms:.2f} ms, '
+                f'ускорение {drf_ms / fast_ms:.1f}x'
+            )
@@ -0,0 +1,91 @@
+import json
+import logging
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('api.sql')
+
+
+class QueryStats:
+
+    def __init__(self, slow_query_ms):
+        self.slow_query_ms = slow_query_ms
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+        self.slow = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = (time.perf_counter() - start) * 1000
+            self.count += 1
+            self.duration += duration
+            self.statements[sql] += 1
+            if duration >= self.slow_query_ms:
+                self.slow.append((sql, duration))
+
+
+def get_view_name(view_func, method):
+    view_class = getattr(view_func, 'cls', None)
+    if view_class is None:
+        return getattr(view_func, '__name__', repr(view_func))
+    actions = getattr(view_func, 'actions', None) or {}
+    action = actions.get(method.lower(), method.lower())
+    return f'{view_class.__name__}.{action}'
+
+
+class SQLInstrumentationMiddleware:
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        config = settings.SQL_INSTRUMENTATION
+        stats = QueryStats(config['SLOW_QUERY_MS'])
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            response = self.get_response(request)
+        timing = (
+            f'db;dur={stats.duration:.2f};desc="{stats.count} queries"'
+        )
+        if response.has_header('Server-Timing'):
+            timing = f'{response["Server-Timing"]}, {timing}'
+        response['Server-Timing'] = timing
+        self.log(request, response, stats, config)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.view_name = get_view_name(view_func, request.method)
+
+    def log(self, request, response, stats, config):
+        record = {
+            'view': getattr(request, 'view_name', None),
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'queries': stats.count,
+            'db_ms': round(stats.duration, 2),
+        }
+        logger.info(json.dumps(record, ensure_ascii=False))
+        duplicates = [
+            {'sql': sql, 'count': count}
+            for sql, count in stats.statements.most_common()
+            if count >= config['DUPLICATE_QUERY_LIMIT']
+        ]
+        if duplicates:
+            logger.warning(json.dumps(
+                {**record, 'duplicates': duplicates}, ensure_ascii=False
+            ))
+        for sql, duration in stats.slow:
+            logger.warning(json.dumps(
+                {**record, 'slow_query': sql, 'ms': round(duration, 2)},
+                ensure_ascii=False
+            ))
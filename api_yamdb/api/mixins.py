@@ -1,9 +1,197 @@
+import time
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
 from rest_framework import mixins, viewsets, filters
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
 
+from reviews.db import get_replica, read_database, retry_on_lock, use_database
+from .cache import get_detail_cache, get_detail_cache_key
 from .permissions import IsAdminOrReadOnly
 
 
+class ReplicaReadMixin:
+
+    def get_replica_pin_key(self, request):
+        return f'replica-pin:{request.user.pk}'
+
+    def dispatch(self, request, *args, **kwargs):
+        with use_database(None):
+            return super().dispatch(request, *args, **kwargs)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        authenticated = request.user.is_authenticated
+        key = self.get_replica_pin_key(request)
+        if request.method not in SAFE_METHODS:
+            if authenticated:
+                cache.set(key, True, settings.REPLICA_STICKY_SECONDS)
+        elif not (authenticated and cache.get(key)):
+            read_database.set(get_replica())
+
+
+class CachedListMixin:
+    list_cache_timeout = settings.LIST_CACHE_TIMEOUT
+
+    @property
+    def list_cache(self):
+        return caches[settings.LIST_CACHE_ALIAS]
+
+    def get_list_cache_prefix(self):
+        return f'list:{self.queryset.model._meta.label_lower}'
+
+    def get_list_cache_version(self):
+        return self.list_cache.get_or_set(
+            f'{self.get_list_cache_prefix()}:version', time.time_ns, None
+        )
+
+    def get_list_cache_key(self, request):
+        params = sorted(request.query_params.lists())
+        digest = md5(f'{request.get_host()}{params}'.encode()).hexdigest()
+        return f'{self.get_list_cache_prefix()}:{digest}'
+
+    def invalidate_list_cache(self):
+        key = f'{self.get_list_cache_prefix()}:version'
+        try:
+            self.list_cache.incr(key)
+        except ValueError:
+            self.list_cache.set(key, time.time_ns(), None)
+
+    def list(self, request, *args, **kwargs):
+        key = self.get_list_cache_key(request)
+        version = self.get_list_cache_version()
+        data = self.list_cache.get(key, version=version)
+        if data is not None:
+            return Response(data)
+        with use_database(None):
+            response = super().list(request, *args, **kwargs)
+        self.list_cache.set(
+            key, response.data, self.list_cache_timeout, version=version
+        )
+        return response
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        self.invalidate_list_cache()
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        self.invalidate_list_cache()
+
+
+class ConditionalGetMixin:
+
+    def get_list_etag_source(self):
+        return None
+
+    def get_detail_etag_source(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return self.get_queryset().filter(**{
+            self.lookup_field: self.kwargs[lookup_url_kwarg]
+        }).values_list('updated_at', flat=True).first()
+
+    def get_etag(self, request, source):
+        if source is None:
+            return None
+        digest = md5(
+            f'{request.get_full_path()}|{request.accepted_renderer.format}|'
+            f'{source}'.encode()
+        ).hexdigest()
+        return f'W/"{digest}"'
+
+    def conditional_response(self, handler, source, request, *args,
+                             **kwargs):
+        etag = self.get_etag(request, source)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if etag is not None:
+            response['ETag'] = etag
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().list, self.get_list_etag_source(),
+            request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().retrieve, self.get_detail_etag_source(),
+            request, *args, **kwargs
+        )
+
+
+class CachedDetailMixin:
+    detail_cache_timeout = settings.DETAIL_CACHE_TIMEOUT
+
+    def retrieve(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        if (
+            renderer.format != 'json'
+            or request.accepted_media_type != renderer.media_type
+            or request.query_params
+        ):
+            return super().retrieve(request, *args, **kwargs)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        key = get_detail_cache_key(
+            self.queryset.model, self.kwargs[lookup_url_kwarg]
+        )
+        cached = get_detail_cache().get(key)
+        if cached is None:
+            with use_database(None):
+                response = super().retrieve(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            cached = (
+                response.get('ETag'),
+                renderer.render(
+                    response.data,
+                    request.accepted_media_type,
+                    self.get_renderer_context()
+                ),
+            )
+            get_detail_cache().set(key, cached, self.detail_cache_timeout)
+        etag, content = cached
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(content, content_type=renderer.media_type)
+        if etag is not None:
+            response['ETag'] = etag
+        return response
+
+
+class FastReadMixin:
+    fast_serializer_class = None
+
+    def get_serializer_class(self):
+        if (
+            self.fast_serializer_class is not None
+            and self.request.method in ('GET', 'HEAD')
+        ):
+            return self.fast_serializer_class
+        return super().get_serializer_class()
+
+
+class RetryOnLockMixin:
+
+    def create(self, request, *args, **kwargs):
+        return retry_on_lock(super().create, request, *args, **kwargs)
+
+    def update(self, request, *args, **kwargs):
+        return retry_on_lock(super().update, request, *args, **kwargs)
+
+    def destroy(self, request, *args, **kwargs):
+        return retry_on_lock(super().destroy, request, *args, **kwargs)
+
+
 class ListCreateDestroyViewSet(
+    ReplicaReadMixin,
+    CachedListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     mixins.DestroyModelMixin,
@@ -0,0 +1,106 @@
+from collections import OrderedDict
+from functools import partial
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+
+from reviews.db import estimate_count
+
+
+class ApproximateCountPaginator(Paginator):
+
+    def __init__(self, object_list, per_page, estimate=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.estimate = estimate
+        self.approximate = False
+
+    @cached_property
+    def count(self):
+        limit = settings.PAGINATION_EXACT_COUNT_LIMIT
+        estimate = self.get_estimate()
+        if estimate is None or estimate <= limit:
+            exact = self.object_list.order_by()[:limit + 1].count()
+            if exact <= limit:
+                return exact
+            estimate = cache.get_or_set(
+                self.get_count_cache_key(),
+                self.object_list.count,
+                settings.PAGINATION_COUNT_CACHE_TIMEOUT
+            )
+        self.approximate = True
+        return estimate
+
+    def get_count_cache_key(self):
+        return 'count:{}'.format(
+            md5(str(self.object_list.query).encode()).hexdigest()
+        )
+
+    def get_estimate(self):
+        estimate = self.estimate() if self.estimate is not None else None
+        if estimate is None:
+            estimate = estimate_count(self.object_list)
+        if estimate is None:
+            estimate = cache.get(self.get_count_cache_key())
+        return estimate
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.approximate:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(
+            self.object_list[bottom:bottom + self.per_page], number, self
+        )
+
+
+class ApproximateCountPagination(PageNumberPagination):
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.django_paginator_class = partial(
+            ApproximateCountPaginator,
+            estimate=getattr(view, 'get_count_estimate', None)
+        )
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('count', self.page.paginator.count),
+            ('count_approximate', self.page.paginator.approximate),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+
+class KeysetPagination(CursorPagination):
+
+    def get_ordering(self, request, queryset, view):
+        return tuple(view.cursor_ordering)
+
+
+class OptionalCursorPagination(ApproximateCountPagination):
+    mode_query_param = 'pagination'
+    cursor_mode = 'cursor'
+
+    def use_cursor(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == self.cursor_mode
+            or KeysetPagination.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.use_cursor(request):
+            self.keyset = KeysetPagination()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
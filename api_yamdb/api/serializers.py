@@ -1,6 +1,4 @@
 from django.conf import settings
-from django.db.models import Avg
-from django.shortcuts import get_object_or_404
 from rest_framework import serializers
 
 from reviews.models import Category, Comment, Genre, Review, Title, User
@@ -59,16 +57,21 @@ class TitleWriteSializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'rating')
 
     def get_rating(self, obj):
-        queryset_avg = Title.objects.annotate(rating=Avg('reviews__score'))
-        title = queryset_avg.get(pk=obj.pk)
-        if title.rating is None:
+        if obj.rating is None:
             return None
-        return round(title.rating)
+        return round(obj.rating)
 
     def validate_year(self, value):
         return year_validator(value)
 
 
+class TitleBulkSerializer(TitleWriteSializer):
+    category = serializers.SlugField(max_length=settings.SLUG_LENGTH)
+    genre = serializers.ListField(
+        child=serializers.SlugField(max_length=settings.SLUG_LENGTH)
+    )
+
+
 class ReviewSerializer(serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         read_only=True,
@@ -85,21 +88,6 @@ class ReviewSerializer(serializers.ModelSerializer):
         fields = ('id', 'text', 'author', 'score', 'pub_date')
         read_only_fields = ('id',)
 
-    def validate(self, data):
-        request = self.context['request']
-        if request.method != 'POST':
-            return data
-        title_id = self.context['view'].kwargs.get('title_id')
-        title = get_object_or_404(Title, pk=title_id)
-        if Review.objects.filter(
-                author=request.user,
-                title=title
-        ).exists():
-            raise serializers.ValidationError(
-                'Отзыв на это произведение уже написан.'
-            )
-        return data
-
 
 class CommentSerializer(serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
@@ -113,6 +101,53 @@ class CommentSerializer(serializers.ModelSerializer):
         read_only_fields = ('id',)
 
 
+datetime_field = serializers.DateTimeField()
+
+
+def represent_slug_object(obj):
+    if obj is None:
+        return None
+    return {'name': obj.name, 'slug': obj.slug}
+
+
+class TitleReadFastSerializer(serializers.BaseSerializer):
+
+    def to_representation(self, title):
+        return {
+            'id': title.id,
+            'name': title.name,
+            'year': title.year,
+            'rating': None if title.rating is None else int(title.rating),
+            'description': title.description,
+            'genre': [represent_slug_object(genre)
+                      for genre in title.genre.all()],
+            'category': represent_slug_object(title.category),
+        }
+
+
+class ReviewFastSerializer(serializers.BaseSerializer):
+
+    def to_representation(self, review):
+        return {
+            'id': review.id,
+            'text': review.text,
+            'author': review.author.username,
+            'score': review.score,
+            'pub_date': datetime_field.to_representation(review.pub_date),
+        }
+
+
+class CommentFastSerializer(serializers.BaseSerializer):
+
+    def to_representation(self, comment):
+        return {
+            'id': comment.id,
+            'text': comment.text,
+            'author': comment.author.username,
+            'pub_date': datetime_field.to_representation(comment.pub_date),
+        }
+
+
 class SignUpSerializer(serializers.Serializer):
     username = serializers.CharField(
         max_length=settings.USERNAME_LENGTH,
@@ -152,3 +187,9 @@ class MeSerializer(UserSerializer):
 
     class Meta(UserSerializer.Meta):
         read_only_fields = ('role',)
+
+    def update(self, instance, validated_data):
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
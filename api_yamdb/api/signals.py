@@ -0,0 +1,65 @@
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_delete)
+from django.dispatch import receiver
+
+from reviews.models import Category, Genre, Review, Title, User
+from reviews.signals import catalog_changed
+from .authentication import invalidate_cached_user
+from .cache import invalidate_catalog, invalidate_detail_cache
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user(sender, instance, **kwargs):
+    invalidate_cached_user(instance.pk)
+
+
+@receiver(post_save, sender=Title)
+@receiver(post_delete, sender=Title)
+def invalidate_title(sender, instance, **kwargs):
+    invalidate_detail_cache(Title, [instance.pk])
+    invalidate_catalog()
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def invalidate_title_genres(sender, instance, action, reverse, pk_set,
+                            **kwargs):
+    if action.startswith('post_'):
+        invalidate_catalog()
+    if not reverse:
+        if action.startswith('post_'):
+            invalidate_detail_cache(Title, [instance.pk])
+    elif action == 'pre_clear':
+        invalidate_detail_cache(
+            Title, instance.title_set.values_list('pk', flat=True)
+        )
+    elif action in ('post_add', 'post_remove'):
+        invalidate_detail_cache(Title, pk_set)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_review_title(sender, instance, **kwargs):
+    old_title_id, _ = getattr(instance, '_rated', (None, None))
+    invalidate_detail_cache(Title, {instance.title_id, old_title_id})
+    invalidate_catalog()
+
+
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+@receiver(post_save, sender=Genre)
+@receiver(pre_delete, sender=Genre)
+def invalidate_catalog_titles(sender, instance, created=False, **kwargs):
+    if created:
+        return
+    invalidate_catalog()
+    lookup = 'category' if sender is Category else 'genre'
+    invalidate_detail_cache(Title, Title.objects.filter(
+        **{lookup: instance}
+    ).values_list('pk', flat=True))
+
+
+@receiver(catalog_changed)
+def invalidate_changed_catalog(sender, pks, **kwargs):
+    invalidate_catalog()
+    invalidate_detail_cache(Title, pks)
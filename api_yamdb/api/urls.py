@@ -3,6 +3,7 @@ from rest_framework.routers import DefaultRouter
 
 from .views import (
     CategoryViewSet,
+    ExportView,
     GenreViewSet,
     TitleViewSet,
     UserViewSet,
@@ -33,4 +34,5 @@ urlpatterns = [
     path('v1/', include(router_v1.urls)),
     path('v1/auth/signup/', SignUpView.as_view(), name='signup'),
     path('v1/auth/token/', GetTokenView.as_view(), name='token'),
+    path('v1/export/<str:table>/', ExportView.as_view(), name='export'),
 ]
@@ -1,20 +1,35 @@
 from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
 from django.core.mail import send_mail
-from django.db import IntegrityError
-from django.db.models import Avg
+from django.db import IntegrityError, OperationalError
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.relations import SlugRelatedField
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import AccessToken
 
-from reviews.models import Category, Genre, Review, Title, User
+from reviews.db import is_locked, retry_on_lock
+from reviews.export import EXPORTS, FORMATS, export_lines
+from reviews.models import (Category, Genre, OutgoingEmail, Review, Title,
+                            User)
+from .cache import get_catalog_version, invalidate_catalog
 from .filters import TitlesFilter
-from .mixins import ListCreateDestroyViewSet
+from .mixins import (
+    CachedDetailMixin,
+    ConditionalGetMixin,
+    FastReadMixin,
+    ListCreateDestroyViewSet,
+    ReplicaReadMixin,
+    RetryOnLockMixin,
+)
+from .pagination import OptionalCursorPagination
 from .permissions import (
     IsAdminRole,
     IsAdminOrReadOnly,
@@ -22,15 +37,19 @@ from .permissions import (
 )
 from .serializers import (
     CategorySerializer,
+    CommentFastSerializer,
     CommentSerializer,
     GenreSerializer,
+    TitleBulkSerializer,
     TitleWriteSializer,
     TitleReadSerializer,
     UserSerializer,
     MeSerializer,
     SignUpSerializer,
     TokenSerializer,
+    ReviewFastSerializer,
     ReviewSerializer,
+    TitleReadFastSerializer,
 )
 
 
@@ -44,45 +63,215 @@ class GenreViewSet(ListCreateDestroyViewSet):
     serializer_class = GenreSerializer
 
 
-class TitleViewSet(viewsets.ModelViewSet):
-    queryset = Title.objects.annotate(rating=Avg('reviews__score'))
+def get_missing_slugs(data, categories, genres):
+    message = str(
+        SlugRelatedField.default_error_messages['does_not_exist']
+    )
+    errors = {}
+    if data['category'] not in categories:
+        errors['category'] = [
+            message.format(slug_name='slug', value=data['category'])
+        ]
+    missing = [slug for slug in data['genre'] if slug not in genres]
+    if missing:
+        errors['genre'] = [
+            message.format(slug_name='slug', value=slug) for slug in missing
+        ]
+    return errors
+
+
+class TitleViewSet(
+    ReplicaReadMixin,
+    CachedDetailMixin,
+    FastReadMixin,
+    ConditionalGetMixin,
+    viewsets.ModelViewSet
+):
+    serializer_class = TitleReadSerializer
+    fast_serializer_class = TitleReadFastSerializer
+    queryset = Title.objects.select_related(
+        'category'
+    ).prefetch_related('genre')
     permission_classes = (IsAdminOrReadOnly,)
     filter_backends = (DjangoFilterBackend,)
     filterset_class = TitlesFilter
     ordering_fields = ('rating', 'name')
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ('id',)
+
+    def get_detail_etag_source(self):
+        return Title.objects.filter(pk=self.kwargs['pk']).values_list(
+            'version', flat=True
+        ).first()
 
     def get_serializer_class(self):
-        if self.request.method == 'GET':
-            return TitleReadSerializer
+        if self.request.method in ('GET', 'HEAD'):
+            return super().get_serializer_class()
         return TitleWriteSializer
 
+    def get_list_etag_source(self):
+        return get_catalog_version()
+
+    @action(
+        methods=('post',),
+        detail=False,
+        permission_classes=(IsAdminRole,)
+    )
+    def bulk(self, request):
+        items = request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    'Ожидается непустой список произведений.'
+                ]
+            })
+        if len(items) > settings.TITLE_BULK_MAX_SIZE:
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    'Не больше {} произведений за запрос.'.format(
+                        settings.TITLE_BULK_MAX_SIZE
+                    )
+                ]
+            })
+        errors = {}
+        valid = []
+        for index, item in enumerate(items):
+            serializer = TitleBulkSerializer(data=item)
+            if serializer.is_valid():
+                valid.append((index, serializer.validated_data))
+            else:
+                errors[index] = serializer.errors
+        try:
+            created = retry_on_lock(self.bulk_create_titles, valid, errors)
+        except (IntegrityError, OperationalError) as error:
+            if isinstance(error, OperationalError) and not is_locked(error):
+                raise
+            return Response(
+                {'detail': 'Произведения не сохранены из-за параллельной '
+                           'записи, повторите запрос.'},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(
+            {
+                'created': created,
+                'errors': [
+                    {'index': index, 'errors': errors[index]}
+                    for index in sorted(errors)
+                ],
+            },
+            status=(
+                status.HTTP_201_CREATED if created
+                else status.HTTP_400_BAD_REQUEST
+            )
+        )
+
+    def bulk_create_titles(self, items, errors):
+        categories = Category.objects.in_bulk(
+            {data['category'] for _, data in items}, field_name='slug'
+        )
+        genres = Genre.objects.in_bulk(
+            {slug for _, data in items for slug in data['genre']},
+            field_name='slug'
+        )
+        titles = []
+        title_genres = []
+        for index, data in items:
+            missing = get_missing_slugs(data, categories, genres)
+            if missing:
+                errors[index] = missing
+                continue
+            titles.append(Title(
+                name=data['name'],
+                year=data['year'],
+                description=data.get('description'),
+                category=categories[data['category']],
+            ))
+            title_genres.append(list(dict.fromkeys(data['genre'])))
+        Title.bulk_create_with_genres(titles, [
+            [genres[slug].pk for slug in slugs] for slugs in title_genres
+        ])
+        if titles:
+            invalidate_catalog()
+        return [
+            {
+                'id': title.pk,
+                'name': title.name,
+                'year': title.year,
+                'rating': None,
+                'description': title.description,
+                'genre': slugs,
+                'category': title.category.slug,
+            }
+            for title, slugs in zip(titles, title_genres)
+        ]
+
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(
+    ReplicaReadMixin,
+    FastReadMixin,
+    RetryOnLockMixin,
+    ConditionalGetMixin,
+    viewsets.ModelViewSet
+):
     serializer_class = ReviewSerializer
+    fast_serializer_class = ReviewFastSerializer
     permission_classes = (IsAdminModeratorAuthOrReadOnly,)
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ('-pub_date', '-id')
 
     def get_title(self):
-        return get_object_or_404(Title, pk=self.kwargs.get('title_id'))
+        if not hasattr(self, '_title'):
+            self._title = get_object_or_404(
+                Title, pk=self.kwargs.get('title_id')
+            )
+        return self._title
 
     def get_queryset(self):
-        return self.get_title().reviews.all()
+        return self.get_title().reviews.select_related('author')
+
+    def get_list_etag_source(self):
+        return self.get_title().version
+
+    def get_count_estimate(self):
+        return self.get_title().reviews_count
 
     def perform_create(self, serializer):
-        serializer.save(
-            author=self.request.user,
-            title=self.get_title()
-        )
+        try:
+            serializer.save(
+                author=self.request.user,
+                title=self.get_title()
+            )
+        except IntegrityError:
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    'Отзыв на это произведение уже написан.'
+                ]
+            })
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(
+    ReplicaReadMixin,
+    FastReadMixin,
+    RetryOnLockMixin,
+    ConditionalGetMixin,
+    viewsets.ModelViewSet
+):
     serializer_class = CommentSerializer
+    fast_serializer_class = CommentFastSerializer
     permission_classes = (IsAdminModeratorAuthOrReadOnly,)
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ('-pub_date', '-id')
 
     def get_review(self):
         return get_object_or_404(Review, pk=self.kwargs.get('review_id'))
 
     def get_queryset(self):
-        return self.get_review().comments.all()
+        return self.get_review().comments.select_related('author')
+
+    def get_list_etag_source(self):
+        return Title.objects.filter(
+            reviews__id=self.kwargs.get('review_id')
+        ).values_list('version', flat=True).first()
 
     def perform_create(self, serializer):
         serializer.save(
@@ -139,9 +328,18 @@ class SignUpView(APIView):
 
     def send_confirmation_code(self, user):
         confirmation_code = default_token_generator.make_token(user)
+        subject = 'Код подтверждения'
+        message = f'Код подтверждения {confirmation_code}'
+        if settings.EMAIL_OUTBOX:
+            return OutgoingEmail.objects.create(
+                subject=subject,
+                body=message,
+                from_email=settings.ADMIN_EMAIL,
+                recipient=user.email,
+            )
         return send_mail(
-            'Код подтверждения',
-            f'Код подтверждения {confirmation_code}',
+            subject,
+            message,
             settings.ADMIN_EMAIL,
             [user.email],
             fail_silently=False,
@@ -164,3 +362,24 @@ class GetTokenView(APIView):
             )
         token = AccessToken.for_user(user)
         return Response({'token': str(token)}, status=status.HTTP_200_OK)
+
+
+class ExportView(APIView):
+    permission_classes = (IsAdminRole,)
+
+    def get(self, request, table):
+        if table not in EXPORTS:
+            raise NotFound(f'Таблица {table} не найдена.')
+        output = request.query_params.get('output', 'ndjson')
+        if output not in FORMATS:
+            raise ValidationError(
+                {'output': [f'Допустимые значения: {", ".join(FORMATS)}.']}
+            )
+        extension, content_type = FORMATS[output]
+        response = StreamingHttpResponse(
+            export_lines(table, output), content_type=content_type
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="{table}.{extension}"'
+        )
+        return response
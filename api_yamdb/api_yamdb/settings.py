@@ -1,13 +1,37 @@
 import os
 from datetime import timedelta
+from itertools import zip_longest
+
+from django.core.exceptions import ImproperlyConfigured
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-SECRET_KEY = 'p&l%385148kslhtyn^##a1)ilz@4zqj=rq&agdol^##zgl9(vs'
+PRODUCTION = os.getenv('DJANGO_ENV', 'development') == 'production'
+
+if PRODUCTION:
+    missing = [
+        name for name in (
+            'DJANGO_SECRET_KEY',
+            'DJANGO_ALLOWED_HOSTS',
+            'DJANGO_CACHE_BACKEND',
+            'DJANGO_CACHE_LOCATION',
+        )
+        if not os.getenv(name)
+    ]
+    if missing:
+        raise ImproperlyConfigured(
+            'Для DJANGO_ENV=production задайте переменные окружения: '
+            + ', '.join(missing)
+        )
+
+SECRET_KEY = os.getenv(
+    'DJANGO_SECRET_KEY',
+    'p&l%385148kslhtyn^##a1)ilz@4zqj=rq&agdol^##zgl9(vs'
+)
 
-DEBUG = True
+DEBUG = os.getenv('DJANGO_DEBUG', str(not PRODUCTION)) == 'True'
 
-ALLOWED_HOSTS = ['*']
+ALLOWED_HOSTS = os.getenv('DJANGO_ALLOWED_HOSTS', '*').split(',')
 
 
 INSTALLED_APPS = [
@@ -26,6 +50,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'api.middleware.SQLInstrumentationMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -41,7 +66,6 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [TEMPLATES_DIR],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -49,20 +73,112 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            'loaders': [
+                'django.template.loaders.filesystem.Loader',
+                'django.template.loaders.app_directories.Loader',
+            ],
         },
     },
 ]
 
+if not DEBUG:
+    TEMPLATES[0]['OPTIONS']['loaders'] = [(
+        'django.template.loaders.cached.Loader',
+        TEMPLATES[0]['OPTIONS']['loaders'],
+    )]
+
 WSGI_APPLICATION = 'api_yamdb.wsgi.application'
 
 
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+        'ENGINE': os.getenv('DB_ENGINE', 'django.db.backends.sqlite3'),
+        'NAME': os.getenv('DB_NAME', os.path.join(BASE_DIR, 'db.sqlite3')),
+        'USER': os.getenv('DB_USER', ''),
+        'PASSWORD': os.getenv('DB_PASSWORD', ''),
+        'HOST': os.getenv('DB_HOST', ''),
+        'PORT': os.getenv('DB_PORT', ''),
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', 60 if PRODUCTION else 0)),
     }
 }
 
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'mmap_size': 268435456,
+    'cache_size': -65536,
+}
+
+SQLITE_LOCK_RETRIES = 3
+
+SQLITE_LOCK_RETRY_DELAY = 0.05
+
+if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    DATABASES['default']['OPTIONS'] = {
+        'connect_timeout': 5,
+        'options': '-c statement_timeout={}'.format(
+            os.getenv('DB_STATEMENT_TIMEOUT', '30000')
+        ),
+    }
+
+for index, (host, name) in enumerate(zip_longest(
+    filter(None, os.getenv('DB_REPLICA_HOSTS', '').split(',')),
+    filter(None, os.getenv('DB_REPLICA_NAMES', '').split(',')),
+), 1):
+    DATABASES[f'replica{index}'] = {
+        **DATABASES['default'],
+        'HOST': host or DATABASES['default']['HOST'],
+        'NAME': name or DATABASES['default']['NAME'],
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+
+DATABASE_ROUTERS = ['reviews.db.ReplicaRouter']
+
+REPLICA_STICKY_SECONDS = int(os.getenv('DB_REPLICA_STICKY_SECONDS', 5))
+
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'DJANGO_CACHE_BACKEND',
+            'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv('DJANGO_CACHE_LOCATION', 'yamdb'),
+    }
+}
+
+SHARED_CACHE_BACKENDS = ('memcached', 'redis')
+
+if PRODUCTION and not any(
+    name in CACHES['default']['BACKEND'].lower()
+    for name in SHARED_CACHE_BACKENDS
+):
+    raise ImproperlyConfigured(
+        'Для DJANGO_ENV=production в DJANGO_CACHE_BACKEND нужен общий '
+        'для всех процессов кеш в памяти: memcached или redis.'
+    )
+
+LIST_CACHE_ALIAS = 'default'
+
+LIST_CACHE_TIMEOUT = 300
+
+DETAIL_CACHE_ALIAS = 'default'
+
+DETAIL_CACHE_TIMEOUT = 300
+
+AUTH_USER_CACHE_ALIAS = 'default'
+
+AUTH_USER_CACHE_TIMEOUT = 300
+
+TITLE_BULK_MAX_SIZE = 1000
+
+PAGINATION_EXACT_COUNT_LIMIT = 10000
+
+PAGINATION_COUNT_CACHE_TIMEOUT = 60
+
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -101,23 +217,57 @@ EMAIL_FILE_PATH = os.path.join(BASE_DIR, 'sent_emails')
 
 ADMIN_EMAIL = 'YaMdb@example.com'
 
+EMAIL_OUTBOX = os.getenv('DJANGO_EMAIL_OUTBOX', str(PRODUCTION)) == 'True'
+
+EMAIL_OUTBOX_BATCH_SIZE = 100
+
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+
+EMAIL_OUTBOX_RETRY_DELAY = 60
+
 AUTH_USER_MODEL = 'reviews.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
     ],
 
     'DEFAULT_PAGINATION_CLASS':
-        'rest_framework.pagination.PageNumberPagination',
+        'api.pagination.ApproximateCountPagination',
     'PAGE_SIZE': 10,
 }
 
+if PRODUCTION:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
+        'rest_framework.renderers.JSONRenderer',
+    ]
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=7),
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+SQL_INSTRUMENTATION = {
+    'SLOW_QUERY_MS': 100,
+    'DUPLICATE_QUERY_LIMIT': 5,
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'api.sql': {
+            'handlers': ['console'],
+            'level': 'INFO',
+        },
+    },
+}
+
 USERNAME_LENGTH = 150
 
 EMAIL_LENGTH = 254
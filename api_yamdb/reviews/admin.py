@@ -1,6 +1,7 @@
 from django.contrib import admin
 
-from .models import Category, Comment, Genre, Review, Title, User
+from .models import (Category, Comment, Genre, OutgoingEmail, Review, Title,
+                     User)
 
 
 class UserAdmin(admin.ModelAdmin):
@@ -18,5 +19,6 @@ admin.site.register(User, UserAdmin)
 admin.site.register(Category)
 admin.site.register(Comment)
 admin.site.register(Genre)
+admin.site.register(OutgoingEmail)
 admin.site.register(Review)
 admin.site.register(Title)
@@ -0,0 +1,90 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connection as default_connection
+from django.db import OperationalError, connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+LOCKED_ERRORS = ('database is locked', 'database table is locked')
+
+read_database = ContextVar('read_database', default=None)
+
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for pragma, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {pragma} = {value}')
+
+
+def is_locked(error):
+    return any(message in str(error) for message in LOCKED_ERRORS)
+
+
+def retry_on_lock(func, *args, **kwargs):
+    retries = settings.SQLITE_LOCK_RETRIES
+    for attempt in range(retries + 1):
+        try:
+            return func(*args, **kwargs)
+        except OperationalError as error:
+            if (
+                attempt == retries
+                or not is_locked(error)
+                or default_connection.in_atomic_block
+            ):
+                raise
+            time.sleep(settings.SQLITE_LOCK_RETRY_DELAY * 2 ** attempt)
+
+
+def estimate_count(queryset):
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql' or queryset.query.where:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+            [queryset.model._meta.db_table]
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def get_replica():
+    if not settings.DATABASE_REPLICAS:
+        return None
+    return random.choice(settings.DATABASE_REPLICAS)
+
+
+@contextmanager
+def use_database(alias):
+    token = read_database.set(alias)
+    try:
+        yield
+    finally:
+        read_database.reset(token)
+
+
+class ReplicaRouter:
+    primary_app_labels = ('django_cache',)
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label in self.primary_app_labels:
+            return 'default'
+        return read_database.get() or 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, **hints):
+        return db not in settings.DATABASE_REPLICAS
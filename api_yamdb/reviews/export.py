@@ -0,0 +1,91 @@
+import csv
+import json
+from datetime import datetime
+
+from .models import Category, Comment, Genre, Review, Title, TitleGenre, User
+
+CHUNK_SIZE = 2000
+
+EXPORTS = {
+    'users': (User, (
+        ('id', 'id'),
+        ('username', 'username'),
+        ('email', 'email'),
+        ('role', 'role'),
+        ('bio', 'bio'),
+        ('first_name', 'first_name'),
+        ('last_name', 'last_name'),
+    )),
+    'category': (Category, (
+        ('id', 'id'), ('name', 'name'), ('slug', 'slug'),
+    )),
+    'genre': (Genre, (
+        ('id', 'id'), ('name', 'name'), ('slug', 'slug'),
+    )),
+    'titles': (Title, (
+        ('id', 'id'),
+        ('name', 'name'),
+        ('year', 'year'),
+        ('category', 'category_id'),
+        ('description', 'description'),
+    )),
+    'genre_title': (TitleGenre, (
+        ('id', 'id'), ('title_id', 'title_id'), ('genre_id', 'genre_id'),
+    )),
+    'review': (Review, (
+        ('id', 'id'),
+        ('title_id', 'title_id'),
+        ('text', 'text'),
+        ('author', 'author_id'),
+        ('score', 'score'),
+        ('pub_date', 'pub_date'),
+    )),
+    'comments': (Comment, (
+        ('id', 'id'),
+        ('review_id', 'review_id'),
+        ('text', 'text'),
+        ('author', 'author_id'),
+        ('pub_date', 'pub_date'),
+    )),
+}
+
+FORMATS = {
+    'csv': ('csv', 'text/csv; charset=utf-8'),
+    'ndjson': ('ndjson', 'application/x-ndjson; charset=utf-8'),
+}
+
+
+class Echo:
+
+    def write(self, value):
+        return value
+
+
+def to_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat(timespec='milliseconds').replace(
+            '+00:00', 'Z'
+        )
+    return value
+
+
+def iter_rows(table):
+    model, columns = EXPORTS[table]
+    rows = model.objects.order_by('pk').values_list(
+        *(field for _, field in columns)
+    ).iterator(chunk_size=CHUNK_SIZE)
+    for row in rows:
+        yield [to_value(value) for value in row]
+
+
+def export_lines(table, output='csv'):
+    names = [column for column, _ in EXPORTS[table][1]]
+    if output == 'ndjson':
+        for row in iter_rows(table):
+            yield json.dumps(dict(zip(names, row)), ensure_ascii=False) + '\n'
+        return
+    writer = csv.writer(Echo(), lineterminator='\n')
+    yield writer.writerow(names)
+    for row in iter_rows(table):
+        yield writer.writerow(['' if value is None else value
+                               for value in row])
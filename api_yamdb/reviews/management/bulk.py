@@ -0,0 +1,31 @@
+from contextlib import contextmanager
+
+from django.core.management.color import no_style
+from django.db import connection
+
+from reviews.models import Comment, Review
+
+
+@contextmanager
+def keep_pub_date(model):
+    if model not in (Review, Comment):
+        yield
+        return
+    field = model._meta.get_field('pub_date')
+    field.auto_now_add = False
+    try:
+        yield
+    finally:
+        field.auto_now_add = True
+
+
+def next_pk(model):
+    last = model.objects.order_by('-pk').values_list('pk', flat=True).first()
+    return (last or 0) + 1
+
+
+def reset_sequences(models):
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
@@ -0,0 +1,146 @@
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from reviews.db import is_locked
+
+SCHEMA = (
+    'CREATE TABLE title ('
+    'id INTEGER PRIMARY KEY, rating_sum INTEGER, reviews_count INTEGER)',
+    'CREATE TABLE review ('
+    'id INTEGER PRIMARY KEY, title_id INTEGER, score INTEGER, text TEXT)',
+    'CREATE INDEX review_title ON review (title_id)',
+)
+TITLES = 100
+
+
+def connect(path, pragmas):
+    connection = sqlite3.connect(
+        path, isolation_level=None, check_same_thread=False
+    )
+    for pragma, value in pragmas.items():
+        connection.execute(f'PRAGMA {pragma} = {value}')
+    return connection
+
+
+class Workload:
+
+    def __init__(self, path, pragmas, seconds):
+        self.path = path
+        self.pragmas = pragmas
+        self.retry = bool(pragmas)
+        self.deadline = time.monotonic() + seconds
+        self.result = {'reads': 0, 'writes': 0, 'retries': 0, 'errors': 0}
+        self.lock = threading.Lock()
+
+    def count(self, key):
+        with self.lock:
+            self.result[key] += 1
+
+    def read(self):
+        connection = connect(self.path, self.pragmas)
+        while time.monotonic() < self.deadline:
+            title_id = random.randint(1, TITLES)
+            connection.execute(
+                'SELECT id, score, text FROM review WHERE title_id = ? '
+                'ORDER BY id DESC LIMIT 10', (title_id,)
+            ).fetchall()
+            connection.execute(
+                'SELECT rating_sum, reviews_count FROM title WHERE id = ?',
+                (title_id,)
+            ).fetchone()
+            self.count('reads')
+        connection.close()
+
+    def write(self):
+        connection = connect(self.path, self.pragmas)
+        while time.monotonic() < self.deadline:
+            self.write_review(connection)
+        connection.close()
+
+    def write_review(self, connection):
+        title_id = random.randint(1, TITLES)
+        score = random.randint(1, 10)
+        for attempt in range(settings.SQLITE_LOCK_RETRIES + 1):
+            try:
+                connection.execute('BEGIN')
+                connection.execute(
+                    'INSERT INTO review (title_id, score, text) '
+                    'VALUES (?, ?, ?)', (title_id, score, 'x' * 200)
+                )
+                connection.execute(
+                    'UPDATE title SET rating_sum = rating_sum + ?, '
+                    'reviews_count = reviews_count + 1 WHERE id = ?',
+                    (score, title_id)
+                )
+                connection.execute('COMMIT')
+                self.count('writes')
+                return
+            except sqlite3.OperationalError as error:
+                if connection.in_transaction:
+                    connection.execute('ROLLBACK')
+                if not is_locked(error):
+                    raise
+                if not self.retry or attempt == settings.SQLITE_LOCK_RETRIES:
+                    self.count('errors')
+                    return
+                self.count('retries')
+                time.sleep(settings.SQLITE_LOCK_RETRY_DELAY * 2 ** attempt)
+
+
+class Command(BaseCommand):
+    help = (
+        'Сравнивает пропускную способность SQLite при параллельных чтениях '
+        'и записях отзывов без настроек и с SQLITE_PRAGMAS.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=4)
+        parser.add_argument('--writers', type=int, default=4)
+        parser.add_argument('--seconds', type=float, default=5)
+
+    def handle(self, *args, **options):
+        seconds = options['seconds']
+        for name, pragmas in (
+            ('default', {}),
+            ('tuned', settings.SQLITE_PRAGMAS),
+        ):
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'benchmark.sqlite3')
+                result = self.run(path, pragmas, options)
+            self.stdout.write(
+                f'{name}: чтений {result["reads"] / seconds:.0f}/с, '
+                f'записей {result["writes"] / seconds:.0f}/с, '
+                f'повторов {result["retries"]}, '
+                f'ошибок блокировки {result["errors"]}'
+            )
+
+    def run(self, path, pragmas, options):
+        connection = connect(path, pragmas)
+        for sql in SCHEMA:
+            connection.execute(sql)
+        connection.executemany(
+            'INSERT INTO title VALUES (?, 0, 0)',
+            ((pk,) for pk in range(1, TITLES + 1))
+        )
+        connection.close()
+
+        workload = Workload(path, pragmas, options['seconds'])
+        threads = [
+            threading.Thread(target=workload.read)
+            for _ in range(options['readers'])
+        ] + [
+            threading.Thread(target=workload.write)
+            for _ in range(options['writers'])
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return workload.result
@@ -0,0 +1,77 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+
+from reviews.models import Comment, Review, Title, TitleGenre
+
+PAGE_SIZE = 10
+
+
+def get_samples():
+    title = Review.objects.values('title_id').annotate(
+        total=Count('pk')
+    ).order_by('-total').first()
+    review = Comment.objects.values('review_id').annotate(
+        total=Count('pk')
+    ).order_by('-total').first()
+    year = Title.objects.values('year', 'category_id').annotate(
+        total=Count('pk')
+    ).order_by('-total').first()
+    if not (title and review and year):
+        raise CommandError(
+            'Нет данных для замеров, выполните generate_data.'
+        )
+    genre_id = TitleGenre.objects.filter(
+        title_id=title['title_id']
+    ).values_list('genre_id', flat=True).first()
+    return {
+        'title_id': title['title_id'],
+        'review_id': review['review_id'],
+        'year': year['year'],
+        'category_id': year['category_id'],
+        'genre_id': genre_id,
+    }
+
+
+def get_queries(samples):
+    return (
+        ('reviews-page', Review.objects.filter(
+            title_id=samples['title_id']
+        ).order_by('-pub_date', '-id')[:PAGE_SIZE]),
+        ('comments-page', Comment.objects.filter(
+            review_id=samples['review_id']
+        ).order_by('-pub_date', '-id')[:PAGE_SIZE]),
+        ('titles-year', Title.objects.filter(
+            year=samples['year']
+        ).order_by('id')[:PAGE_SIZE]),
+        ('titles-category-year', Title.objects.filter(
+            category_id=samples['category_id'], year=samples['year']
+        ).order_by('id')[:PAGE_SIZE]),
+        ('title-genre', TitleGenre.objects.filter(
+            title_id=samples['title_id'], genre_id=samples['genre_id']
+        )),
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        'Показывает план выполнения и медианное время основных запросов '
+        'к отзывам, комментариям и произведениям.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=200)
+
+    def handle(self, *args, **options):
+        for name, queryset in get_queries(get_samples()):
+            timings = []
+            for _ in range(options['repeat']):
+                start = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - start) * 1000)
+            self.stdout.write(
+                f'{name}: {statistics.median(timings):.3f} ms\n'
+                f'{queryset.explain()}\n'
+            )
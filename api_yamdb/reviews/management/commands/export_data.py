@@ -0,0 +1,42 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from reviews.export import EXPORTS, FORMATS, export_lines
+
+
+class Command(BaseCommand):
+    help = (
+        'Выгружает таблицы в CSV или NDJSON построчно, в формате файлов '
+        'static/data, пригодном для import_csv.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default='.',
+            help='Каталог для файлов выгрузки.'
+        )
+        parser.add_argument(
+            '--output',
+            choices=sorted(FORMATS),
+            default='csv'
+        )
+        parser.add_argument(
+            '--tables',
+            nargs='+',
+            choices=list(EXPORTS),
+            default=list(EXPORTS)
+        )
+
+    def handle(self, *args, **options):
+        os.makedirs(options['path'], exist_ok=True)
+        extension, _ = FORMATS[options['output']]
+        for table in options['tables']:
+            path = os.path.join(options['path'], f'{table}.{extension}')
+            rows = -1 if options['output'] == 'csv' else 0
+            with open(path, 'w', encoding='utf-8', newline='') as file:
+                for line in export_lines(table, options['output']):
+                    file.write(line)
+                    rows += 1
+            self.stdout.write(f'{table}: выгружено {rows} в {path}')
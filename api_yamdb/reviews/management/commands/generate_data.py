@@ -0,0 +1,209 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from reviews.management.bulk import keep_pub_date, next_pk, reset_sequences
+from reviews.models import (RATING_FIELDS, Category, Comment, Genre, Review,
+                            Title, TitleGenre, User)
+from reviews.signals import catalog_changed
+
+START_DATE = datetime(2015, 1, 1, tzinfo=timezone.utc)
+PERIOD = timedelta(days=365 * 8)
+MAX_TITLE_GENRES = 3
+
+
+def zipf_counts(total, buckets, skew, limit, rng):
+    weights = [1 / rank ** skew for rank in range(1, buckets + 1)]
+    weight_sum = sum(weights)
+    counts = [min(int(total * weight / weight_sum), limit)
+              for weight in weights]
+    left = total - sum(counts)
+    while left:
+        for index in range(buckets):
+            if not left:
+                break
+            if counts[index] < limit:
+                counts[index] += 1
+                left -= 1
+    rng.shuffle(counts)
+    return counts
+
+
+class Command(BaseCommand):
+    help = (
+        'Генерирует синтетические данные для нагрузочного тестирования: '
+        'пользователей, категории, жанры, произведения, отзывы и комментарии.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--categories', type=int, default=10)
+        parser.add_argument('--genres', type=int, default=30)
+        parser.add_argument('--titles', type=int, default=1000)
+        parser.add_argument('--reviews', type=int, default=10000)
+        parser.add_argument('--comments', type=int, default=10000)
+        parser.add_argument(
+            '--skew',
+            type=float,
+            default=1.1,
+            help='Показатель распределения Ципфа для отзывов на произведение.'
+        )
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        if options['reviews'] > options['titles'] * options['users']:
+            raise CommandError(
+                'Отзывов больше, чем пар пользователь-произведение.'
+            )
+        if options['comments'] and not options['reviews']:
+            raise CommandError('Для комментариев нужны отзывы.')
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.users = self.generate_users(options['users'])
+        self.categories = self.generate_named(
+            Category, options['categories'], 'Категория', 'category'
+        )
+        self.genres = self.generate_named(
+            Genre, options['genres'], 'Жанр', 'genre'
+        )
+        self.titles = self.generate_titles(options['titles'])
+        self.reviews = self.generate_reviews(
+            options['reviews'], options['skew']
+        )
+        self.generate_comments(options['comments'])
+        reset_sequences([User, Category, Genre, Title, Review, Comment])
+        catalog_changed.send(sender=self.__class__, pks=self.titles)
+
+    def insert(self, model, objects):
+        batch = []
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) >= self.batch_size:
+                model.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            model.objects.bulk_create(batch)
+
+    def report(self, model, first, count):
+        self.stdout.write(
+            f'{model._meta.verbose_name_plural}: {count} '
+            f'(id {first}-{first + count - 1})'
+        )
+        return range(first, first + count)
+
+    def pub_date(self):
+        return START_DATE + PERIOD * self.rng.random()
+
+    def generate_users(self, count):
+        first = next_pk(User)
+        password = make_password(None)
+        with transaction.atomic():
+            self.insert(User, (
+                User(
+                    pk=pk,
+                    username=f'user{pk}',
+                    email=f'user{pk}@yamdb.fake',
+                    password=password,
+                )
+                for pk in range(first, first + count)
+            ))
+        return self.report(User, first, count)
+
+    def generate_named(self, model, count, name, slug):
+        first = next_pk(model)
+        with transaction.atomic():
+            self.insert(model, (
+                model(pk=pk, name=f'{name} {pk}', slug=f'{slug}-{pk}')
+                for pk in range(first, first + count)
+            ))
+        return self.report(model, first, count)
+
+    def generate_titles(self, count):
+        first = next_pk(Title)
+        with transaction.atomic():
+            self.insert(Title, (
+                Title(
+                    pk=pk,
+                    name=f'Произведение {pk}',
+                    year=self.rng.randint(1900, START_DATE.year),
+                    category_id=(
+                        self.rng.choice(self.categories)
+                        if self.categories else None
+                    ),
+                )
+                for pk in range(first, first + count)
+            ))
+            if self.genres:
+                self.insert(TitleGenre, (
+                    TitleGenre(title_id=pk, genre_id=genre_id)
+                    for pk in range(first, first + count)
+                    for genre_id in self.rng.sample(
+                        self.genres,
+                        self.rng.randint(
+                            1, min(MAX_TITLE_GENRES, len(self.genres))
+                        )
+                    )
+                ))
+        return self.report(Title, first, count)
+
+    def generate_reviews(self, count, skew):
+        first = next_pk(Review)
+        counts = zipf_counts(
+            count, len(self.titles), skew, len(self.users), self.rng
+        )
+        pk = first
+        batch = []
+        titles = []
+        with keep_pub_date(Review):
+            for title_id, reviews_count in zip(self.titles, counts):
+                if not reviews_count:
+                    continue
+                scores = [self.rng.randint(1, 10)
+                          for _ in range(reviews_count)]
+                authors = self.rng.sample(self.users, reviews_count)
+                for author_id, score in zip(authors, scores):
+                    batch.append(Review(
+                        pk=pk,
+                        title_id=title_id,
+                        author_id=author_id,
+                        score=score,
+                        text=f'Отзыв {pk}',
+                        pub_date=self.pub_date(),
+                    ))
+                    pk += 1
+                rating_sum = sum(scores)
+                titles.append(Title(
+                    pk=title_id,
+                    rating_sum=rating_sum,
+                    reviews_count=reviews_count,
+                    rating=rating_sum / reviews_count,
+                ))
+                if len(batch) >= self.batch_size:
+                    self.save_reviews(batch, titles)
+                    batch, titles = [], []
+            self.save_reviews(batch, titles)
+        return self.report(Review, first, count)
+
+    def save_reviews(self, reviews, titles):
+        with transaction.atomic():
+            Review.objects.bulk_create(reviews)
+            Title.objects.bulk_update(titles, RATING_FIELDS)
+
+    def generate_comments(self, count):
+        first = next_pk(Comment)
+        with keep_pub_date(Comment), transaction.atomic():
+            self.insert(Comment, (
+                Comment(
+                    pk=pk,
+                    review_id=self.rng.choice(self.reviews),
+                    author_id=self.rng.choice(self.users),
+                    text=f'Комментарий {pk}',
+                    pub_date=self.pub_date(),
+                )
+                for pk in range(first, first + count)
+            ))
+        return self.report(Comment, first, count)
@@ -0,0 +1,243 @@
+import csv
+import json
+import os
+from collections import defaultdict
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+
+from reviews.management.bulk import keep_pub_date, reset_sequences
+from reviews.models import (Category, Comment, Genre, Review, Title,
+                            TitleGenre, User)
+from reviews.signals import catalog_changed
+
+DATA_DIR = os.path.join(settings.BASE_DIR, 'static', 'data')
+
+SOURCES = (
+    ('users.csv', User, 'build_user'),
+    ('category.csv', Category, 'build_category'),
+    ('genre.csv', Genre, 'build_genre'),
+    ('titles.csv', Title, 'build_title'),
+    ('genre_title.csv', TitleGenre, 'build_title_genre'),
+    ('review.csv', Review, 'build_review'),
+    ('comments.csv', Comment, 'build_comment'),
+)
+
+
+def to_int(value):
+    return int(value) if value else None
+
+
+class Command(BaseCommand):
+    help = (
+        'Загружает данные из CSV-файлов static/data в базу данных '
+        'пакетными вставками.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default=DATA_DIR,
+            help='Каталог с CSV-файлами.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Количество строк в одном bulk_create.'
+        )
+        parser.add_argument(
+            '--commit-every',
+            type=int,
+            default=0,
+            help='Фиксировать транзакцию каждые N строк (0 - один файл).'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            help='JSON-файл с прогрессом загрузки для возобновления.'
+        )
+
+    def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+        self.commit_every = options['commit_every']
+        self.checkpoint_path = options['checkpoint']
+        self.checkpoint = self.load_checkpoint()
+        self.password = make_password(None)
+        self.ids = {
+            model: set(model.objects.values_list('pk', flat=True))
+            for model in (User, Category, Genre, Title, Review)
+        }
+        self.ratings = defaultdict(lambda: [0, 0])
+        self.changed_titles = set()
+        for filename, model, build in SOURCES:
+            path = os.path.join(options['path'], filename)
+            if not os.path.exists(path):
+                self.stdout.write(f'{filename}: файл не найден, пропущен')
+                continue
+            with keep_pub_date(model):
+                self.import_file(path, filename, model, getattr(self, build))
+        reset_sequences([model for _, model, _ in SOURCES])
+        catalog_changed.send(sender=self.__class__, pks=self.changed_titles)
+
+    def load_checkpoint(self):
+        if not self.checkpoint_path or not os.path.exists(
+                self.checkpoint_path):
+            return {}
+        with open(self.checkpoint_path, encoding='utf-8') as file:
+            return json.load(file)
+
+    def save_checkpoint(self):
+        if not self.checkpoint_path:
+            return
+        with open(self.checkpoint_path, 'w', encoding='utf-8') as file:
+            json.dump(self.checkpoint, file)
+
+    def import_file(self, path, filename, model, build):
+        done = self.checkpoint.get(filename, 0)
+        created = skipped = 0
+        with open(path, encoding='utf-8', newline='') as file:
+            rows = csv.DictReader(file)
+            for _ in islice(rows, done):
+                pass
+            while True:
+                chunk = islice(rows, self.commit_every) if (
+                    self.commit_every) else rows
+                with transaction.atomic():
+                    read, inserted = self.load_rows(chunk, model, build)
+                    self.apply_ratings()
+                if not read:
+                    break
+                done += read
+                created += inserted
+                skipped += read - inserted
+                self.checkpoint[filename] = done
+                self.save_checkpoint()
+        self.stdout.write(
+            f'{filename}: загружено {created}, пропущено {skipped}'
+        )
+
+    def load_rows(self, rows, model, build):
+        read = inserted = 0
+        batch = []
+        known = self.ids.get(model, ())
+        for row in rows:
+            read += 1
+            if int(row['id']) in known:
+                continue
+            obj = build(row)
+            if obj is None:
+                continue
+            batch.append(obj)
+            if len(batch) >= self.batch_size:
+                inserted += self.insert(model, batch)
+                batch = []
+        if batch:
+            inserted += self.insert(model, batch)
+        return read, inserted
+
+    def insert(self, model, batch):
+        pks = {obj.pk for obj in batch}
+        existing = self.stored_pks(model, pks)
+        model.objects.bulk_create(batch, ignore_conflicts=True)
+        landed = self.stored_pks(model, pks) - existing
+        if model in self.ids:
+            self.ids[model].update(landed)
+        if model is Title:
+            self.changed_titles.update(landed)
+        elif model is TitleGenre:
+            self.changed_titles.update(
+                obj.title_id for obj in batch if obj.pk in landed
+            )
+        if model is Review:
+            for review in batch:
+                if review.pk in landed:
+                    self.ratings[review.title_id][0] += review.score
+                    self.ratings[review.title_id][1] += 1
+        return len(landed)
+
+    def stored_pks(self, model, pks):
+        return pks & set(model.objects.filter(
+            pk__range=(min(pks), max(pks))
+        ).values_list('pk', flat=True))
+
+    def apply_ratings(self):
+        for title_id, (score_sum, count) in self.ratings.items():
+            Title.change_rating(title_id, score_sum, count)
+        self.changed_titles.update(self.ratings)
+        self.ratings.clear()
+
+    def known(self, model, pk):
+        return pk is not None and pk in self.ids[model]
+
+    def build_user(self, row):
+        return User(
+            pk=int(row['id']),
+            username=row['username'],
+            email=row['email'],
+            role=row['role'],
+            bio=row['bio'],
+            first_name=row['first_name'],
+            last_name=row['last_name'],
+            password=self.password,
+        )
+
+    def build_category(self, row):
+        return Category(pk=int(row['id']), name=row['name'], slug=row['slug'])
+
+    def build_genre(self, row):
+        return Genre(pk=int(row['id']), name=row['name'], slug=row['slug'])
+
+    def build_title(self, row):
+        category_id = to_int(row['category'])
+        if category_id is not None and not self.known(Category, category_id):
+            return None
+        return Title(
+            pk=int(row['id']),
+            name=row['name'],
+            year=int(row['year']),
+            category_id=category_id,
+            description=row.get('description') or None,
+        )
+
+    def build_title_genre(self, row):
+        title_id = to_int(row['title_id'])
+        genre_id = to_int(row['genre_id'])
+        if not (self.known(Title, title_id) and self.known(Genre, genre_id)):
+            return None
+        return TitleGenre(
+            pk=int(row['id']), title_id=title_id, genre_id=genre_id
+        )
+
+    def build_review(self, row):
+        title_id = to_int(row['title_id'])
+        author_id = to_int(row['author'])
+        if not (self.known(Title, title_id) and self.known(User, author_id)):
+            return None
+        return Review(
+            pk=int(row['id']),
+            title_id=title_id,
+            author_id=author_id,
+            text=row['text'],
+            score=int(row['score']),
+            pub_date=parse_datetime(row['pub_date']),
+        )
+
+    def build_comment(self, row):
+        review_id = to_int(row['review_id'])
+        author_id = to_int(row['author'])
+        if not (
+                self.known(Review, review_id)
+                and self.known(User, author_id)
+        ):
+            return None
+        return Comment(
+            pk=int(row['id']),
+            review_id=review_id,
+            author_id=author_id,
+            text=row['text'],
+            pub_date=parse_datetime(row['pub_date']),
+        )
@@ -0,0 +1,66 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from reviews.models import RATING_FIELDS, Title
+from reviews.signals import catalog_changed
+
+BATCH_SIZE = 1000
+UPDATE_FIELDS = (*RATING_FIELDS, 'version', 'updated_at')
+
+
+class Command(BaseCommand):
+    help = (
+        'Пересчитывает сохранённый рейтинг произведений по отзывам '
+        'и сообщает о произведениях с расхождениями.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Только сообщить о расхождениях, не исправляя их.'
+        )
+
+    def handle(self, *args, **options):
+        titles = Title.objects.annotate(
+            score_sum=Sum('reviews__score'),
+            score_count=Count('reviews')
+        ).order_by('pk')
+        drifted = []
+        batch = []
+        now = timezone.now()
+        with transaction.atomic():
+            for title in titles.iterator():
+                rating_sum = title.score_sum or 0
+                reviews_count = title.score_count
+                rating = rating_sum / reviews_count if reviews_count else None
+                stored = (title.rating_sum, title.reviews_count, title.rating)
+                if stored == (rating_sum, reviews_count, rating):
+                    continue
+                drifted.append(title.pk)
+                self.stdout.write(
+                    f'{title.pk} «{title}»: '
+                    f'сумма {title.rating_sum} -> {rating_sum}, '
+                    f'отзывов {title.reviews_count} -> {reviews_count}, '
+                    f'рейтинг {title.rating} -> {rating}'
+                )
+                if options['dry_run']:
+                    continue
+                title.rating_sum = rating_sum
+                title.reviews_count = reviews_count
+                title.rating = rating
+                title.version = F('version') + 1
+                title.updated_at = now
+                batch.append(title)
+                if len(batch) >= BATCH_SIZE:
+                    Title.objects.bulk_update(batch, UPDATE_FIELDS)
+                    batch = []
+            if batch:
+                Title.objects.bulk_update(batch, UPDATE_FIELDS)
+        if drifted and not options['dry_run']:
+            catalog_changed.send(sender=self.__class__, pks=drifted)
+        self.stdout.write(self.style.SUCCESS(
+            f'Произведений с расхождениями: {len(drifted)}'
+        ))
@@ -0,0 +1,106 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from reviews.models import OutgoingEmail
+
+CLAIM_FIELDS = ('attempts', 'send_after')
+
+
+class Command(BaseCommand):
+    help = (
+        'Отправляет письма из очереди исходящих пакетами через одно '
+        'соединение с почтовым сервером, повторяя неудачные попытки '
+        'с экспоненциальной задержкой.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.EMAIL_OUTBOX_BATCH_SIZE
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Не завершаться, а проверять очередь каждые --interval '
+                 'секунд.'
+        )
+        parser.add_argument('--interval', type=float, default=5)
+
+    def handle(self, *args, **options):
+        while True:
+            sent = failed = 0
+            while True:
+                batch_sent, batch_failed = self.deliver(options['batch_size'])
+                sent += batch_sent
+                failed += batch_failed
+                if batch_sent + batch_failed < options['batch_size']:
+                    break
+            if sent or failed or not options['loop']:
+                self.stdout.write(f'Отправлено {sent}, с ошибкой {failed}')
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
+
+    def deliver(self, batch_size):
+        emails = self.claim(batch_size)
+        if not emails:
+            return 0, 0
+        sent = 0
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as error:
+            for email in emails:
+                self.fail(email, error)
+        else:
+            for email in emails:
+                sent += self.send(connection, email)
+            connection.close()
+        return sent, len(emails) - sent
+
+    def claim(self, batch_size):
+        now = timezone.now()
+        with transaction.atomic():
+            emails = list(OutgoingEmail.objects.select_for_update(
+                skip_locked=True
+            ).filter(
+                sent_at=None,
+                send_after__lte=now,
+                attempts__lt=settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+            ).order_by('send_after')[:batch_size])
+            for email in emails:
+                email.attempts += 1
+                email.send_after = now + timedelta(
+                    seconds=settings.EMAIL_OUTBOX_RETRY_DELAY
+                    * 2 ** (email.attempts - 1)
+                )
+            OutgoingEmail.objects.bulk_update(emails, CLAIM_FIELDS)
+        return emails
+
+    def send(self, connection, email):
+        try:
+            EmailMessage(
+                email.subject,
+                email.body,
+                email.from_email,
+                [email.recipient],
+                connection=connection
+            ).send()
+        except Exception as error:
+            self.fail(email, error)
+            return 0
+        email.sent_at = timezone.now()
+        email.last_error = ''
+        email.save(update_fields=('sent_at', 'last_error'))
+        return 1
+
+    def fail(self, email, error):
+        email.last_error = str(error) or repr(error)
+        email.save(update_fields=('last_error',))
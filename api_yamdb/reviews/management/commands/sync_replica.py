@@ -0,0 +1,33 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = (
+        'Копирует основную базу SQLite в файлы реплик. Заменяет '
+        'репликацию при локальной проверке чтения с реплик.'
+    )
+
+    def handle(self, *args, **options):
+        primary = connections['default']
+        if primary.vendor != 'sqlite':
+            raise CommandError(
+                'Команда работает только с SQLite, реплики PostgreSQL '
+                'настраиваются средствами СУБД.'
+            )
+        if not settings.DATABASE_REPLICAS:
+            raise CommandError(
+                'Реплики не настроены, задайте DB_REPLICA_NAMES.'
+            )
+        primary.ensure_connection()
+        for alias in settings.DATABASE_REPLICAS:
+            connections[alias].close()
+            target = sqlite3.connect(connections[alias].settings_dict['NAME'])
+            try:
+                primary.connection.backup(target)
+            finally:
+                target.close()
+            self.stdout.write(f'{alias}: скопирована основная база')
@@ -0,0 +1,44 @@
+# Generated by Django 2.2.16 on 2026-10-18 01:58
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def fill_ratings(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    titles = Title.objects.annotate(
+        score_sum=Sum('reviews__score'),
+        score_count=Count('reviews')
+    ).filter(score_count__gt=0)
+    for title in titles.iterator():
+        Title.objects.filter(pk=title.pk).update(
+            rating_sum=title.score_sum,
+            reviews_count=title.score_count,
+            rating=title.score_sum / title.score_count
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0004_auto_20221211_1105'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='rating',
+            field=models.FloatField(editable=False, null=True, verbose_name='Рейтинг'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Сумма оценок'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='reviews_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество отзывов'),
+        ),
+        migrations.RunPython(fill_ratings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 2.2.16 on 2026-10-18 02:24
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def remove_duplicate_title_genres(apps, schema_editor):
+    TitleGenre = apps.get_model('reviews', 'TitleGenre')
+    first_ids = TitleGenre.objects.values('title_id', 'genre_id').annotate(
+        first_id=Min('id')
+    ).values('first_id')
+    TitleGenre.objects.exclude(id__in=first_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0009_outgoing_email'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='comment',
+            options={'ordering': ('-pub_date', '-id'), 'verbose_name': 'Комментарий', 'verbose_name_plural': 'Комментарии'},
+        ),
+        migrations.AlterModelOptions(
+            name='review',
+            options={'ordering': ('-pub_date', '-id'), 'verbose_name': 'Отзыв', 'verbose_name_plural': 'Отзывы'},
+        ),
+        migrations.AlterModelOptions(
+            name='title',
+            options={'ordering': ('id',), 'verbose_name': 'Произведение', 'verbose_name_plural': 'Произведения'},
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['review', 'pub_date', 'id'], name='comment_review_pub_date'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['title', 'pub_date', 'id'], name='review_title_pub_date'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['year'], name='title_year'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(fields=['category', 'year'], name='title_category_year'),
+        ),
+        migrations.RunPython(
+            remove_duplicate_title_genres, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='titlegenre',
+            constraint=models.UniqueConstraint(fields=('title', 'genre'), name='unique_title_genre'),
+        ),
+    ]
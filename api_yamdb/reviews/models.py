@@ -1,7 +1,10 @@
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import connections, models, router, transaction
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast, NullIf
+from django.utils import timezone
 
 from .validators import year_validator, username_validator
 
@@ -17,6 +20,8 @@ ROLE_CHOICES = (
 
 ROLE_MAX_LENGTH = max(len(role) for role, _ in ROLE_CHOICES)
 
+RATING_FIELDS = ('rating_sum', 'reviews_count', 'rating')
+
 
 class User(AbstractUser):
     username = models.CharField(
@@ -102,20 +107,108 @@ class Title(models.Model):
         related_name='titles',
         null=True,
     )
+    rating_sum = models.PositiveIntegerField(
+        'Сумма оценок',
+        default=0,
+        editable=False
+    )
+    reviews_count = models.PositiveIntegerField(
+        'Количество отзывов',
+        default=0,
+        editable=False
+    )
+    rating = models.FloatField(
+        'Рейтинг',
+        null=True,
+        editable=False
+    )
+    updated_at = models.DateTimeField('Дата изменения', auto_now=True)
+    version = models.PositiveIntegerField(
+        'Версия',
+        default=1,
+        editable=False
+    )
 
     class Meta:
+        ordering = ('id',)
+        indexes = [
+            models.Index(fields=('year',), name='title_year'),
+            models.Index(
+                fields=('category', 'year'),
+                name='title_category_year'
+            ),
+        ]
         verbose_name = 'Произведение'
         verbose_name_plural = 'Произведения'
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            self.version = F('version') + 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields:
+                kwargs['update_fields'] = {
+                    *update_fields, 'version', 'updated_at'
+                }
+            else:
+                kwargs['update_fields'] = [
+                    field.name for field in self._meta.concrete_fields
+                    if not field.primary_key
+                    and field.name not in RATING_FIELDS
+                ]
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def touch(cls, **lookups):
+        return cls.objects.filter(**lookups).update(
+            version=F('version') + 1,
+            updated_at=timezone.now()
+        )
+
+    @classmethod
+    def change_rating(cls, title_id, score_delta, count_delta):
+        rating_sum = F('rating_sum') + score_delta
+        reviews_count = F('reviews_count') + count_delta
+        return cls.objects.filter(pk=title_id).update(
+            rating_sum=rating_sum,
+            reviews_count=reviews_count,
+            rating=Cast(rating_sum, FloatField()) / NullIf(reviews_count, 0),
+            version=F('version') + 1,
+            updated_at=timezone.now()
+        )
+
+    @classmethod
+    def bulk_create_with_genres(cls, titles, genres):
+        using = router.db_for_write(cls)
+        with transaction.atomic(using=using):
+            cls.objects.using(using).bulk_create(titles)
+            if not connections[using].features.can_return_ids_from_bulk_insert:
+                pks = list(cls.objects.using(using).order_by(
+                    '-pk'
+                ).values_list('pk', flat=True)[:len(titles)])
+                for title, pk in zip(titles, reversed(pks)):
+                    title.pk = pk
+            TitleGenre.objects.using(using).bulk_create(
+                TitleGenre(title_id=title.pk, genre_id=genre_id)
+                for title, genre_ids in zip(titles, genres)
+                for genre_id in genre_ids
+            )
+        return titles
+
 
 class TitleGenre(models.Model):
     title = models.ForeignKey(Title, on_delete=models.CASCADE)
     genre = models.ForeignKey(Genre, on_delete=models.CASCADE)
 
     class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['title', 'genre'],
+                name='unique_title_genre'
+            )
+        ]
         verbose_name = 'Произведение и жанр'
         verbose_name_plural = 'Произведения и жанры'
 
@@ -148,6 +241,7 @@ class Review(models.Model):
         'Дата публикации',
         auto_now_add=True
     )
+    updated_at = models.DateTimeField('Дата изменения', auto_now=True)
 
     class Meta:
         constraints = [
@@ -156,12 +250,23 @@ class Review(models.Model):
                 name='unique_review'
             )
         ]
+        ordering = ('-pub_date', '-id')
+        indexes = [
+            models.Index(
+                fields=('title', 'pub_date', 'id'),
+                name='review_title_pub_date'
+            ),
+        ]
         verbose_name = 'Отзыв'
         verbose_name_plural = 'Отзывы'
 
     def __str__(self):
         return self.text[:30]
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
 
 class Comment(models.Model):
     author = models.ForeignKey(
@@ -175,6 +280,7 @@ class Comment(models.Model):
         auto_now_add=True,
         db_index=True
     )
+    updated_at = models.DateTimeField('Дата изменения', auto_now=True)
     review = models.ForeignKey(
         Review,
         on_delete=models.CASCADE,
@@ -182,8 +288,44 @@ class Comment(models.Model):
     )
 
     class Meta:
+        ordering = ('-pub_date', '-id')
+        indexes = [
+            models.Index(
+                fields=('review', 'pub_date', 'id'),
+                name='comment_review_pub_date'
+            ),
+        ]
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
 
     def __str__(self):
         return self.text[:30]
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class OutgoingEmail(models.Model):
+    subject = models.CharField(max_length=settings.NAME_LENGTH)
+    body = models.TextField()
+    from_email = models.EmailField(max_length=settings.EMAIL_LENGTH)
+    recipient = models.EmailField(max_length=settings.EMAIL_LENGTH)
+    created_at = models.DateTimeField('Дата создания', auto_now_add=True)
+    send_after = models.DateTimeField('Отправить после', default=timezone.now)
+    sent_at = models.DateTimeField('Дата отправки', null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=('sent_at', 'send_after'),
+                name='outgoing_email_due'
+            ),
+        ]
+        verbose_name = 'Исходящее письмо'
+        verbose_name_plural = 'Исходящие письма'
+
+    def __str__(self):
+        return f'{self.recipient}: {self.subject}'
@@ -0,0 +1,89 @@
+from django.db import connections
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = 'reviews_title_fts'
+FTS_MIN_LENGTH = 3
+FTS_MIN_SQLITE_VERSION = (3, 34, 0)
+
+SQLITE_TABLE = (
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+    "name, content='reviews_title', content_rowid='id', tokenize='trigram')",
+)
+SQLITE_TRIGGERS = (
+    f"CREATE TRIGGER {FTS_TABLE}_insert AFTER INSERT ON reviews_title "
+    f"BEGIN INSERT INTO {FTS_TABLE}(rowid, name) "
+    "VALUES (new.id, new.name); END",
+    f"CREATE TRIGGER {FTS_TABLE}_delete AFTER DELETE ON reviews_title "
+    f"BEGIN INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name) "
+    "VALUES ('delete', old.id, old.name); END",
+    f"CREATE TRIGGER {FTS_TABLE}_update AFTER UPDATE OF name "
+    "ON reviews_title BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name) "
+    "VALUES ('delete', old.id, old.name); "
+    f"INSERT INTO {FTS_TABLE}(rowid, name) VALUES (new.id, new.name); "
+    "END",
+)
+SQLITE_REBUILD = (
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+)
+SQLITE_DROP = (
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_update',
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_delete',
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_insert',
+    f'DROP TABLE IF EXISTS {FTS_TABLE}',
+)
+POSTGRESQL_INDEX = (
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE INDEX IF NOT EXISTS reviews_title_name_trgm ON reviews_title '
+    'USING gin (UPPER(name) gin_trgm_ops)',
+)
+POSTGRESQL_DROP = (
+    'DROP INDEX IF EXISTS reviews_title_name_trgm',
+)
+
+
+def has_trigram_fts(connection):
+    return (
+        connection.vendor == 'sqlite'
+        and connection.Database.sqlite_version_info >= FTS_MIN_SQLITE_VERSION
+    )
+
+
+def execute(schema_editor, statements):
+    connection = schema_editor.connection
+    if connection.vendor == 'sqlite' and not has_trigram_fts(connection):
+        return
+    for sql in statements.get(schema_editor.connection.vendor, ()):
+        schema_editor.execute(sql)
+
+
+def create_search_index(apps, schema_editor):
+    execute(schema_editor, {
+        'sqlite': SQLITE_TABLE + SQLITE_TRIGGERS + SQLITE_REBUILD,
+        'postgresql': POSTGRESQL_INDEX,
+    })
+
+
+def drop_search_index(apps, schema_editor):
+    execute(schema_editor, {
+        'sqlite': SQLITE_DROP,
+        'postgresql': POSTGRESQL_DROP,
+    })
+
+
+# SQLite пересобирает reviews_title при изменении схемы и теряет триггеры.
+def restore_search_triggers(apps, schema_editor):
+    execute(schema_editor, {
+        'sqlite': SQLITE_DROP[:3] + SQLITE_TRIGGERS + SQLITE_REBUILD,
+    })
+
+
+def search_titles(queryset, value):
+    connection = connections[queryset.db]
+    if has_trigram_fts(connection) and len(value) >= FTS_MIN_LENGTH:
+        phrase = '"{}"'.format(value.replace('"', '""'))
+        return queryset.filter(pk__in=RawSQL(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s',
+            (phrase,)
+        ))
+    return queryset.filter(name__icontains=value)
@@ -0,0 +1,71 @@
+from django.db.models.signals import (post_delete, post_init, post_save,
+                                      pre_delete)
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from .models import Category, Comment, Genre, Review, Title, User
+
+catalog_changed = Signal(providing_args=['pks'])
+
+
+@receiver(post_init, sender=Review)
+def remember_review_score(sender, instance, **kwargs):
+    instance._rated = (instance.title_id, instance.score)
+
+
+@receiver(post_save, sender=Review)
+def add_review_score(sender, instance, created, **kwargs):
+    old_title_id, old_score = instance._rated
+    if created:
+        Title.change_rating(instance.title_id, instance.score, 1)
+    elif old_title_id != instance.title_id:
+        Title.change_rating(old_title_id, -old_score, -1)
+        Title.change_rating(instance.title_id, instance.score, 1)
+    elif old_score != instance.score:
+        Title.change_rating(instance.title_id, instance.score - old_score, 0)
+    else:
+        Title.touch(pk=instance.title_id)
+    instance._rated = (instance.title_id, instance.score)
+
+
+@receiver(post_delete, sender=Review)
+def remove_review_score(sender, instance, **kwargs):
+    old_title_id, old_score = instance._rated
+    Title.change_rating(old_title_id, -old_score, -1)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def touch_comment_title(sender, instance, **kwargs):
+    Title.touch(reviews__id=instance.review_id)
+
+
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+def touch_category_titles(sender, instance, created=False, **kwargs):
+    if not created:
+        Title.touch(category=instance)
+
+
+@receiver(post_save, sender=Genre)
+@receiver(pre_delete, sender=Genre)
+def touch_genre_titles(sender, instance, created=False, **kwargs):
+    if not created:
+        Title.touch(genre=instance)
+
+
+@receiver(post_init, sender=User)
+def remember_username(sender, instance, **kwargs):
+    instance._username = instance.username
+
+
+@receiver(post_save, sender=User)
+def touch_author_content(sender, instance, created, **kwargs):
+    if created or instance._username == instance.username:
+        return
+    now = timezone.now()
+    Review.objects.filter(author=instance).update(updated_at=now)
+    Comment.objects.filter(author=instance).update(updated_at=now)
+    Title.touch(reviews__author=instance)
+    Title.touch(reviews__comments__author=instance)
+    instance._username = instance.username
@@ -0,0 +1,119 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08TitleRating:
+
+    def get_title(self, title_id):
+        from reviews.models import Title
+        return Title.objects.get(pk=title_id)
+
+    def test_01_rating_follows_reviews(self, admin_client, user_client,
+                                       moderator_client, client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        url = f'/api/v1/titles/{title_id}/'
+
+        create_single_review(admin_client, title_id, 'Отлично', 10)
+        response = create_single_review(user_client, title_id, 'Так себе', 5)
+        review_id = response.json()['id']
+        create_single_review(moderator_client, title_id, 'Плохо', 3)
+        title = self.get_title(title_id)
+        assert (title.rating_sum, title.reviews_count) == (18, 3), (
+            'Проверьте, что при создании отзыва обновляются сумма оценок и '
+            'количество отзывов произведения.'
+        )
+        assert client.get(url).json()['rating'] == 6, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает рейтинг, '
+            'рассчитанный по сохранённым оценкам.'
+        )
+
+        user_client.patch(
+            f'{url}reviews/{review_id}/', data={'score': 8}
+        )
+        title = self.get_title(title_id)
+        assert (title.rating_sum, title.reviews_count) == (21, 3), (
+            'Проверьте, что при изменении оценки отзыва обновляется '
+            'сумма оценок произведения.'
+        )
+        assert title.rating == 7
+
+        user_client.delete(f'{url}reviews/{review_id}/')
+        title = self.get_title(title_id)
+        assert (title.rating_sum, title.reviews_count) == (13, 2), (
+            'Проверьте, что при удалении отзыва обновляются сумма оценок и '
+            'количество отзывов произведения.'
+        )
+        assert title.rating == 6.5
+
+    def test_02_rating_without_reviews(self, admin_client, user_client,
+                                       client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        response = create_single_review(user_client, title_id, 'Ого', 9)
+        user_client.delete(
+            f'/api/v1/titles/{title_id}/reviews/{response.json()["id"]}/'
+        )
+        title = self.get_title(title_id)
+        assert (title.rating_sum, title.reviews_count) == (0, 0)
+        assert title.rating is None
+        response = client.get(f'/api/v1/titles/{title_id}/')
+        assert response.json()['rating'] is None
+
+    def test_03_rebuild_ratings_command(self, admin_client, user_client):
+        from reviews.models import Title
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(user_client, title_id, 'Хорошо', 8)
+        Title.objects.filter(pk=title_id).update(
+            rating_sum=100, reviews_count=5, rating=20
+        )
+
+        out = StringIO()
+        call_command('rebuild_ratings', '--dry-run', stdout=out)
+        assert f'{title_id} ' in out.getvalue(), (
+            'Проверьте, что команда `rebuild_ratings` сообщает о '
+            'произведениях с расхождением рейтинга.'
+        )
+        assert self.get_title(title_id).rating_sum == 100
+
+        call_command('rebuild_ratings', stdout=StringIO())
+        title = self.get_title(title_id)
+        assert (title.rating_sum, title.reviews_count) == (8, 1)
+        assert title.rating == 8
+        assert self.get_title(titles[1]['id']).rating is None
+
+    def test_04_write_response_rating(self, admin_client, user_client,
+                                      moderator_client):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(user_client, title_id, 'Хорошо', 8)
+        create_single_review(moderator_client, title_id, 'Неплохо', 7)
+
+        url = f'/api/v1/titles/{title_id}/'
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.patch(url, data={'name': 'Новое'})
+        title_selects = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT')
+            and 'FROM "reviews_title"' in query['sql']
+        ]
+        assert response.json()['rating'] == 8, (
+            f'Проверьте, что ответ на PATCH-запрос к `{url}` содержит '
+            'округлённый рейтинг произведения.'
+        )
+        assert len(title_selects) == 1, (
+            f'Проверьте, что PATCH-запрос к `{url}` не выполняет '
+            'дополнительный запрос для получения рейтинга.'
+        )
+        assert self.get_title(title_id).reviews_count == 2, (
+            'Проверьте, что сохранение произведения не перезаписывает '
+            'сохранённый рейтинг.'
+        )
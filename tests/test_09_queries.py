@@ -0,0 +1,141 @@
+import pytest
+
+from tests.utils import (create_authors, create_categories, create_genre,
+                         create_title_reviews)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09TitleQueries:
+
+    def create_titles(self, admin_client, count):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        for idx in range(count):
+            admin_client.post('/api/v1/titles/', data={
+                'name': f'Произведение {idx}',
+                'year': 2000,
+                'genre': [genre['slug'] for genre in genres],
+                'category': categories[idx % len(categories)]['slug']
+            })
+
+    @pytest.mark.parametrize('count', (1, 10))
+    def test_01_titles_list_queries(self, admin_client, client,
+                                    django_assert_num_queries, count):
+        self.create_titles(admin_client, count)
+        with django_assert_num_queries(3):
+            response = client.get('/api/v1/titles/')
+        assert len(response.json()['results']) == count, (
+            'Проверьте, что список произведений `/api/v1/titles/` '
+            'загружается фиксированным числом запросов к базе данных: '
+            'count, произведения с категориями и жанры.'
+        )
+        with django_assert_num_queries(2):
+            client.get('/api/v1/titles/', {'pagination': 'cursor'})
+
+    def test_02_title_detail_queries(self, admin_client, client,
+                                     django_assert_num_queries):
+        self.create_titles(admin_client, 1)
+        from reviews.models import Title
+        title_id = Title.objects.get().pk
+        with django_assert_num_queries(3):
+            response = client.get(f'/api/v1/titles/{title_id}/')
+        assert len(response.json()['genre']) == 3, (
+            'Проверьте, что произведение `/api/v1/titles/{title_id}/` '
+            'загружается вместе с категорией и жанрами за три запроса, '
+            'включая валидатор ETag.'
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09ReviewCommentQueries:
+
+    @pytest.mark.parametrize('count', (1, 10))
+    def test_01_reviews_list_queries(self, client, django_user_model,
+                                     django_assert_num_queries, count):
+        from reviews.models import Title
+        title = Title.objects.create(name='Произведение', year=2000)
+        create_title_reviews(django_user_model, title, count)
+        with django_assert_num_queries(3):
+            response = client.get(f'/api/v1/titles/{title.pk}/reviews/')
+        assert len(response.json()['results']) == count, (
+            'Проверьте, что список отзывов загружается вместе с авторами '
+            'фиксированным числом запросов к базе данных.'
+        )
+
+    @pytest.mark.parametrize('count', (1, 10))
+    def test_02_comments_list_queries(self, client, django_user_model,
+                                      django_assert_num_queries, count):
+        from reviews.models import Comment, Review, Title
+        authors = create_authors(django_user_model, count)
+        title = Title.objects.create(name='Произведение', year=2000)
+        review = Review.objects.create(
+            title=title, author=authors[0], text='Отзыв', score=5
+        )
+        for idx, author in enumerate(authors):
+            Comment.objects.create(
+                review=review, author=author, text=f'Комментарий {idx}'
+            )
+        with django_assert_num_queries(4):
+            response = client.get(
+                f'/api/v1/titles/{title.pk}/reviews/{review.pk}/comments/'
+            )
+        assert len(response.json()['results']) == count, (
+            'Проверьте, что список комментариев загружается вместе с '
+            'авторами фиксированным числом запросов к базе данных.'
+        )
+
+    def test_03_review_create_queries(self, user_client, user,
+                                      django_assert_max_num_queries):
+        from reviews.models import Review, Title
+        title = Title.objects.create(name='Произведение', year=2000)
+        url = f'/api/v1/titles/{title.pk}/reviews/'
+        data = {'text': 'Отзыв', 'score': 7}
+        with django_assert_max_num_queries(5):
+            response = user_client.post(url, data=data)
+        assert response.status_code == 201, (
+            'Проверьте, что отзыв создаётся с одним запросом произведения.'
+        )
+        response = user_client.post(url, data=data)
+        assert response.status_code == 400, (
+            'Проверьте, что повторный отзыв автора на произведение '
+            'возвращает статус 400.'
+        )
+        assert response.json() == {
+            'non_field_errors': ['Отзыв на это произведение уже написан.']
+        }
+        title.refresh_from_db()
+        assert Review.objects.count() == 1
+        assert (title.reviews_count, title.rating) == (1, 7), (
+            'Проверьте, что отклонённый отзыв не меняет рейтинг произведения.'
+        )
+
+    @pytest.mark.parametrize('method', ('PATCH', 'DELETE'))
+    def test_04_object_permission_queries(self, admin, moderator, user,
+                                          django_user_model,
+                                          django_assert_num_queries, method):
+        from rest_framework.test import APIRequestFactory, force_authenticate
+        from rest_framework.views import APIView
+
+        from api.permissions import IsAdminModeratorAuthOrReadOnly
+        from reviews.models import Review, Title
+        title = Title.objects.create(name='Произведение', year=2000)
+        Review.objects.create(title=title, author=user, text='Отзыв', score=5)
+        review = Review.objects.get()
+        stranger = django_user_model.objects.create(
+            username='stranger', email='stranger@yamdb.fake'
+        )
+        permission = IsAdminModeratorAuthOrReadOnly()
+        factory = APIRequestFactory()
+        for request_user, expected in ((user, True), (moderator, True),
+                                       (admin, True), (stranger, False)):
+            request = factory.generic(method, '/')
+            force_authenticate(request, user=request_user)
+            request = APIView().initialize_request(request)
+            with django_assert_num_queries(0):
+                allowed = permission.has_object_permission(
+                    request, None, review
+                )
+            assert allowed is expected, (
+                'Проверьте, что права на изменение отзыва проверяются '
+                'по `author_id` без запроса автора к базе данных.'
+            )
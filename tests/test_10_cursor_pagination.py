@@ -0,0 +1,59 @@
+import pytest
+
+from tests.utils import create_title_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10CursorPagination:
+
+    def collect_pages(self, client, url):
+        ids = []
+        pages = 0
+        while url:
+            response = client.get(url)
+            data = response.json()
+            assert 'count' not in data, (
+                'Проверьте, что в режиме `?pagination=cursor` ответ не '
+                'содержит ключ `count`.'
+            )
+            ids.extend(item['id'] for item in data['results'])
+            url = data['next']
+            pages += 1
+        return ids, pages
+
+    def test_01_titles_cursor(self, client):
+        from reviews.models import Title
+        Title.objects.bulk_create(
+            Title(name=f'Произведение {idx}', year=2000) for idx in range(25)
+        )
+        ids, pages = self.collect_pages(
+            client, '/api/v1/titles/?pagination=cursor'
+        )
+        assert ids == sorted(Title.objects.values_list('id', flat=True)), (
+            'Проверьте, что курсорная пагинация `/api/v1/titles/` '
+            'возвращает все произведения по одному разу.'
+        )
+        assert pages == 3
+
+        data = client.get('/api/v1/titles/').json()
+        assert data['count'] == 25, (
+            'Проверьте, что без параметра `pagination=cursor` эндпоинт '
+            '`/api/v1/titles/` использует постраничную пагинацию.'
+        )
+
+    def test_02_reviews_cursor(self, client, django_user_model):
+        from reviews.models import Review, Title
+        title = Title.objects.create(name='Произведение', year=2000)
+        create_title_reviews(django_user_model, title, 15)
+        url = f'/api/v1/titles/{title.pk}/reviews/?pagination=cursor'
+        ids, pages = self.collect_pages(client, url)
+        expected = list(
+            Review.objects.order_by('-pub_date', '-id')
+            .values_list('id', flat=True)
+        )
+        assert ids == expected, (
+            'Проверьте, что курсорная пагинация '
+            '`/api/v1/titles/{title_id}/reviews/` возвращает отзывы '
+            'от новых к старым по одному разу.'
+        )
+        assert pages == 2
@@ -0,0 +1,76 @@
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11TitleFilters:
+    url = '/api/v1/titles/'
+
+    def names(self, client, query):
+        response = client.get(f'{self.url}?{query}')
+        return {title['name'] for title in response.json()['results']}
+
+    def test_01_genre_multiple_values(self, admin_client, client):
+        titles, _, genres = create_titles(admin_client)
+        query = f'genre={genres[0]["slug"]},{genres[2]["slug"]}'
+        assert self.names(client, query) == {
+            titles[0]['name'], titles[1]['name']
+        }, (
+            f'Проверьте, что `{self.url}?genre=a,b` возвращает произведения '
+            'любого из перечисленных жанров без повторов.'
+        )
+        assert self.names(client, f'genre={genres[2]["slug"]}') == {
+            titles[1]['name']
+        }
+
+    def test_02_category_exact_slug(self, admin_client, client):
+        titles, categories, _ = create_titles(admin_client)
+        slug = categories[0]['slug']
+        assert self.names(client, f'category={slug}') == {titles[0]['name']}
+        assert self.names(client, f'category={slug[:-1]}') == set(), (
+            f'Проверьте, что фильтр `{self.url}?category=` сравнивает '
+            'slug категории целиком.'
+        )
+
+    def test_03_name_search(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        assert self.names(client, 'name=ОРЕШ') == {titles[1]['name']}, (
+            f'Проверьте, что `{self.url}?name=` ищет по части названия '
+            'без учёта регистра.'
+        )
+        assert self.names(client, 'name=Те') == {titles[0]['name']}
+
+        admin_client.patch(
+            f'{self.url}{titles[1]["id"]}/', data={'name': 'Чужой'}
+        )
+        assert self.names(client, 'name=орешек') == set(), (
+            'Проверьте, что поисковый индекс обновляется при изменении '
+            'названия произведения.'
+        )
+        assert self.names(client, 'name=чужой') == {'Чужой'}
+
+        admin_client.delete(f'{self.url}{titles[1]["id"]}/')
+        assert self.names(client, 'name=чужой') == set()
+
+    def test_04_old_sqlite_fallback(self, admin_client, client, monkeypatch):
+        from django.db import connection
+
+        from reviews import search
+        titles, _, _ = create_titles(admin_client)
+        monkeypatch.setattr(search, 'FTS_MIN_SQLITE_VERSION', (99, 0, 0))
+        executed = []
+        monkeypatch.setattr(
+            connection.schema_editor().__class__, 'execute',
+            lambda editor, sql, params=(): executed.append(sql)
+        )
+        search.create_search_index(None, connection.schema_editor())
+        assert executed == [], (
+            'Проверьте, что на SQLite без токенизатора trigram поисковый '
+            'индекс не создаётся.'
+        )
+        name = titles[0]['name']
+        assert self.names(client, f'name={name[1:4]}') == {name}, (
+            'Проверьте, что без индекса trigram поиск по названию '
+            'выполняется через `icontains`.'
+        )
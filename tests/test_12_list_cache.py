@@ -0,0 +1,37 @@
+import pytest
+
+from tests.utils import create_categories, create_genre
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12ListCache:
+
+    @pytest.mark.parametrize('url, create', (
+        ('/api/v1/categories/', create_categories),
+        ('/api/v1/genres/', create_genre),
+    ))
+    def test_01_cached_list(self, admin_client, client,
+                            django_assert_num_queries, url, create):
+        objects = create(admin_client)
+        client.get(url)
+        with django_assert_num_queries(0):
+            response = client.get(url)
+        assert response.json()['count'] == len(objects), (
+            f'Проверьте, что повторный GET-запрос к `{url}` отдаётся из кеша '
+            'без обращения к базе данных.'
+        )
+
+        search = f'{url}?search={objects[0]["name"]}'
+        assert client.get(search).json()['count'] == 1, (
+            f'Проверьте, что кеш `{url}` учитывает параметры запроса.'
+        )
+
+        admin_client.post(url, data={'name': 'Новый', 'slug': 'new'})
+        assert client.get(url).json()['count'] == len(objects) + 1, (
+            f'Проверьте, что POST-запрос к `{url}` сбрасывает кеш списка.'
+        )
+
+        admin_client.delete(f'{url}new/')
+        assert client.get(url).json()['count'] == len(objects), (
+            f'Проверьте, что DELETE-запрос к `{url}` сбрасывает кеш списка.'
+        )
@@ -0,0 +1,138 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+
+from tests.utils import create_comments, create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13ConditionalGet:
+
+    def check_not_modified(self, client, url):
+        response = client.get(url)
+        etag = response.get('ETag')
+        assert etag, (
+            f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+            'заголовок `ETag`.'
+        )
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f'Проверьте, что GET-запрос к `{url}` с актуальным '
+            '`If-None-Match` возвращает ответ со статусом 304.'
+        )
+        return etag
+
+    def check_modified(self, client, url, etag):
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что после изменения данных GET-запрос к `{url}` '
+            'с устаревшим `If-None-Match` возвращает ответ со статусом 200.'
+        )
+        assert response['ETag'] != etag
+
+    def test_01_title_detail_and_list(self, admin_client, user_client,
+                                      client):
+        titles, _, _ = create_titles(admin_client)
+        detail_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        list_url = '/api/v1/titles/'
+        detail_etag = self.check_not_modified(client, detail_url)
+        list_etag = self.check_not_modified(client, list_url)
+
+        create_single_review(user_client, titles[0]['id'], 'Хорошо', 8)
+        self.check_modified(client, detail_url, detail_etag)
+        self.check_modified(client, list_url, list_etag)
+
+        detail_etag = self.check_not_modified(client, detail_url)
+        admin_client.patch(detail_url, data={'name': 'Новое название'})
+        self.check_modified(client, detail_url, detail_etag)
+
+    def test_02_reviews_and_comments(self, admin_client, admin, user_client,
+                                     user, client):
+        authors = {admin: admin_client, user: user_client}
+        comments, reviews, titles = create_comments(admin_client, authors)
+        reviews_url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        comments_url = f'{reviews_url}{reviews[0]["id"]}/comments/'
+        comment_url = f'{comments_url}{comments[1]["id"]}/'
+        reviews_etag = self.check_not_modified(client, reviews_url)
+        comments_etag = self.check_not_modified(client, comments_url)
+        comment_etag = self.check_not_modified(client, comment_url)
+
+        user_client.patch(comment_url, data={'text': 'Исправлено'})
+        self.check_modified(client, comments_url, comments_etag)
+        self.check_modified(client, comment_url, comment_etag)
+
+        reviews_etag = self.check_not_modified(client, reviews_url)
+        user_client.patch(
+            f'{reviews_url}{reviews[1]["id"]}/', data={'text': 'Исправлено'}
+        )
+        self.check_modified(client, reviews_url, reviews_etag)
+
+    def test_03_catalog_changes(self, admin_client, client):
+        from reviews.models import Genre
+        _, categories, genres = create_titles(admin_client)
+        list_url = '/api/v1/titles/'
+        list_etag = self.check_not_modified(client, list_url)
+        genre = Genre.objects.get(slug=genres[0]['slug'])
+        genre.name = 'Новый жанр'
+        genre.save()
+        self.check_modified(client, list_url, list_etag)
+
+        list_etag = self.check_not_modified(client, list_url)
+        admin_client.post(f'{list_url}bulk/', data=[{
+            'name': 'Ещё одно',
+            'year': 2000,
+            'genre': [genres[0]['slug']],
+            'category': categories[0]['slug'],
+        }], format='json')
+        self.check_modified(client, list_url, list_etag)
+
+    def test_04_author_rename(self, admin_client, admin, user_client, user,
+                              client):
+        authors = {admin: admin_client, user: user_client}
+        comments, reviews, titles = create_comments(admin_client, authors)
+        reviews_url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        review_url = f'{reviews_url}{reviews[1]["id"]}/'
+        comments_url = f'{reviews_url}{reviews[0]["id"]}/comments/'
+        etags = {
+            url: self.check_not_modified(client, url)
+            for url in (reviews_url, review_url, comments_url)
+        }
+        response = user_client.patch(
+            '/api/v1/users/me/', data={'username': 'RenamedUser'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        for url, etag in etags.items():
+            self.check_modified(client, url, etag)
+
+    def test_05_title_version(self, admin_client, user_client):
+        from django.core.management import call_command
+
+        from reviews.models import Category, Title
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'Хорошо', 8)
+
+        def version():
+            return Title.objects.get(pk=titles[0]['id']).version
+
+        start = version()
+        title = Title.objects.get(pk=titles[0]['id'])
+        title.name = 'Новое название'
+        title.save(update_fields=['name'])
+        assert version() == start + 1, (
+            'Проверьте, что `Title.save(update_fields=...)` увеличивает '
+            '`version`.'
+        )
+        category = Category.objects.get(slug=titles[0]['category'])
+        category.name = 'Новая категория'
+        category.save()
+        assert version() == start + 2, (
+            'Проверьте, что переименование категории увеличивает `version` '
+            'её произведений.'
+        )
+        Title.objects.filter(pk=titles[0]['id']).update(rating_sum=1)
+        call_command('rebuild_ratings', stdout=StringIO())
+        assert version() == start + 3, (
+            'Проверьте, что `rebuild_ratings` увеличивает `version` '
+            'исправленных произведений.'
+        )
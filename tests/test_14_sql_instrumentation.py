@@ -0,0 +1,55 @@
+import json
+import logging
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14SQLInstrumentation:
+
+    def records(self, caplog, level):
+        return [
+            json.loads(record.getMessage()) for record in caplog.records
+            if record.name == 'api.sql' and record.levelno == level
+        ]
+
+    def test_01_server_timing_and_log(self, admin_client, client, caplog):
+        create_titles(admin_client)
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger='api.sql'):
+            response = client.get('/api/v1/titles/')
+        timing = response.get('Server-Timing', '')
+        assert timing.startswith('db;dur=') and 'queries' in timing, (
+            'Проверьте, что ответ содержит заголовок `Server-Timing` '
+            'с количеством и временем SQL-запросов.'
+        )
+        record, = self.records(caplog, logging.INFO)
+        assert record['view'] == 'TitleViewSet.list', (
+            'Проверьте, что строка журнала содержит имя представления DRF.'
+        )
+        assert f'desc="{record["queries"]} queries"' in timing
+
+    def test_02_duplicate_and_slow_queries(self, admin_client, client,
+                                           caplog, settings):
+        titles, _, _ = create_titles(admin_client)
+        settings.SQL_INSTRUMENTATION = {
+            'SLOW_QUERY_MS': 0,
+            'DUPLICATE_QUERY_LIMIT': 1,
+        }
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger='api.sql'):
+            client.get(f'/api/v1/titles/{titles[0]["id"]}/')
+        warnings = self.records(caplog, logging.WARNING)
+        assert any('duplicates' in record for record in warnings), (
+            'Проверьте, что повторяющиеся запросы попадают в журнал '
+            'с уровнем WARNING.'
+        )
+        assert any('slow_query' in record for record in warnings), (
+            'Проверьте, что медленные запросы попадают в журнал '
+            'с уровнем WARNING.'
+        )
+        assert all(
+            record['view'] == 'TitleViewSet.retrieve' for record in warnings
+        )
@@ -0,0 +1,41 @@
+import pytest
+from django.db import OperationalError, connection
+
+
+@pytest.mark.django_db
+class Test15SQLite:
+
+    def test_01_pragmas(self):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA synchronous')
+            synchronous, = cursor.fetchone()
+            cursor.execute('PRAGMA busy_timeout')
+            busy_timeout, = cursor.fetchone()
+        assert synchronous == 1, (
+            'Проверьте, что для SQLite установлен `synchronous=NORMAL`.'
+        )
+        assert busy_timeout == 5000, (
+            'Проверьте, что для SQLite установлен `busy_timeout`.'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_retry_on_lock(self, settings):
+        from reviews.db import retry_on_lock
+        settings.SQLITE_LOCK_RETRY_DELAY = 0
+        calls = []
+
+        def locked_once():
+            calls.append(1)
+            if len(calls) == 1:
+                raise OperationalError('database is locked')
+            return 'ok'
+
+        def locked_always():
+            raise OperationalError('database is locked')
+
+        assert retry_on_lock(locked_once) == 'ok'
+        assert len(calls) == 2, (
+            'Проверьте, что запись повторяется при блокировке базы данных.'
+        )
+        with pytest.raises(OperationalError):
+            retry_on_lock(locked_always)
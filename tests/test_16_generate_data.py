@@ -0,0 +1,60 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Count, Sum
+
+
+def generate(seed):
+    call_command(
+        'generate_data', '--users', '20', '--titles', '30', '--genres', '5',
+        '--categories', '3', '--reviews', '200', '--comments', '50',
+        '--seed', str(seed), '--batch-size', '40', stdout=StringIO()
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16GenerateData:
+
+    def snapshot(self):
+        from reviews.models import Comment, Review
+        return (
+            list(Review.objects.order_by('pk').values_list(
+                'title_id', 'author_id', 'score', 'pub_date'
+            )),
+            list(Comment.objects.order_by('pk').values_list(
+                'review_id', 'author_id'
+            )),
+        )
+
+    def test_01_generate_data(self):
+        from reviews.models import Comment, Review, Title
+        generate(seed=1)
+        assert Review.objects.count() == 200
+        assert Comment.objects.count() == 50
+        titles = Title.objects.annotate(
+            score_sum=Sum('reviews__score'), score_count=Count('reviews')
+        )
+        for title in titles:
+            assert title.reviews_count == title.score_count, (
+                'Проверьте, что `generate_data` заполняет количество отзывов '
+                'произведения.'
+            )
+            assert title.rating_sum == (title.score_sum or 0)
+        counts = sorted(title.score_count for title in titles)
+        assert counts[-1] > 3 * counts[len(counts) // 2], (
+            'Проверьте, что отзывы распределены по произведениям '
+            'неравномерно (по закону Ципфа).'
+        )
+
+    def test_02_generate_data_is_deterministic(self, django_user_model):
+        from reviews.models import Category, Genre, Title
+        generate(seed=5)
+        first = self.snapshot()
+        for model in (Title, Category, Genre, django_user_model):
+            model.objects.all().delete()
+        generate(seed=5)
+        assert self.snapshot() == first, (
+            'Проверьте, что `generate_data` с одинаковым `--seed` создаёт '
+            'одинаковые данные.'
+        )
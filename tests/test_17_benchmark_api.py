@@ -0,0 +1,68 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+
+def benchmark(tmp_path, budgets=''):
+    output = tmp_path / 'results.json'
+    call_command(
+        'benchmark_api', '--sizes', '40', '--requests', '2', '--current-db',
+        '--output', str(output), '--budgets', budgets, stdout=StringIO()
+    )
+    return json.loads(output.read_text(encoding='utf-8'))
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17BenchmarkApi:
+
+    def test_01_results(self, tmp_path):
+        data = benchmark(tmp_path)
+        endpoints = {result['endpoint'] for result in data['results']}
+        for endpoint in ('titles-list', 'titles-detail', 'reviews-list',
+                         'comments-list', 'signup', 'token', 'export'):
+            assert endpoint in endpoints, (
+                f'Проверьте, что `benchmark_api` замеряет маршрут {endpoint}'
+            )
+        routes = {
+            (result['method'], result['endpoint'])
+            for result in data['results']
+        } | {
+            (route['method'], route['endpoint']) for route in data['excluded']
+        }
+        for route in (('POST', 'titles-list'), ('PATCH', 'titles-detail'),
+                      ('POST', 'reviews-list'), ('DELETE', 'comments-detail')):
+            assert route in routes, (
+                'Проверьте, что `benchmark_api` замеряет каждый маршрут '
+                '`api.urls` или указывает причину, по которой он '
+                'не замеряется.'
+            )
+        assert all(route['reason'] for route in data['excluded'])
+        for result in data['results']:
+            assert result['size'] == 40
+            assert result['status'] < 500, (
+                f'Проверьте, что маршрут {result["endpoint"]} отвечает '
+                'без ошибок сервера'
+            )
+            for metric in ('p50_ms', 'p99_ms', 'queries', 'peak_kb'):
+                assert metric in result, (
+                    f'Проверьте, что результаты содержат метрику {metric}'
+                )
+        queries = {
+            (result['endpoint'], result['cache']): result['queries']
+            for result in data['results'] if result['method'] == 'GET'
+        }
+        for endpoint in ('category-list', 'titles-detail'):
+            assert queries[(endpoint, 'cold')] > 0, (
+                f'Проверьте, что маршрут {endpoint} замеряется и с холодным '
+                'кешем, когда ответ собирается из базы данных.'
+            )
+            assert queries[(endpoint, 'warm')] == 0
+
+    def test_02_budgets(self, tmp_path):
+        budgets = tmp_path / 'budgets.json'
+        budgets.write_text(json.dumps({'*': {'queries': 0}}))
+        with pytest.raises(CommandError, match='titles-list'):
+            benchmark(tmp_path, str(budgets))
@@ -0,0 +1,86 @@
+import pytest
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18AuthCache:
+    me_url = '/api/v1/users/me/'
+
+    def test_01_cached_user(self, user_client, django_assert_num_queries):
+        user_client.get(self.me_url)
+        with django_assert_num_queries(0):
+            response = user_client.get(self.me_url)
+        assert response.status_code == 200
+        assert response.json()['username'] == 'TestUser', (
+            'Проверьте, что аутентифицированный пользователь берётся '
+            'из кеша без запроса к базе данных.'
+        )
+
+    def test_02_role_change(self, admin_client, user_client, user):
+        assert user_client.get('/api/v1/users/').status_code == 403
+        response = admin_client.patch(
+            f'/api/v1/users/{user.username}/', data={'role': 'admin'}
+        )
+        assert response.status_code == 200
+        assert user_client.get('/api/v1/users/').status_code == 200, (
+            'Проверьте, что изменение роли через `/api/v1/users/{username}/` '
+            'сразу сбрасывает кешированного пользователя.'
+        )
+
+    def test_03_me_update(self, user_client):
+        user_client.get(self.me_url)
+        response = user_client.patch(self.me_url, data={'bio': 'new bio'})
+        assert response.status_code == 200
+        assert user_client.get(self.me_url).json()['bio'] == 'new bio', (
+            'Проверьте, что изменение профиля через `/api/v1/users/me/` '
+            'сбрасывает кешированного пользователя.'
+        )
+
+    def test_04_deleted_user(self, admin_client, user_client, user):
+        assert user_client.get(self.me_url).status_code == 200
+        response = admin_client.delete(f'/api/v1/users/{user.username}/')
+        assert response.status_code == 204
+        assert user_client.get(self.me_url).status_code == 401, (
+            'Проверьте, что токен удалённого пользователя перестаёт '
+            'действовать сразу после удаления.'
+        )
+
+    def test_05_model_save(self, user_client, user):
+        assert user_client.get('/api/v1/users/').status_code == 403
+        user.role = 'admin'
+        user.save()
+        assert user_client.get('/api/v1/users/').status_code == 200, (
+            'Проверьте, что сохранение пользователя вне API (например, '
+            'в админке Django) сразу сбрасывает кешированного пользователя.'
+        )
+        user.is_active = False
+        user.save()
+        assert user_client.get(self.me_url).status_code == 401, (
+            'Проверьте, что деактивированный пользователь сразу теряет '
+            'доступ.'
+        )
+
+    def test_06_me_update_fields(self, user_client, user):
+        from reviews.models import User
+        user_client.get(self.me_url)
+        User.objects.filter(pk=user.pk).update(role='moderator')
+        response = user_client.patch(self.me_url, data={'bio': 'new bio'})
+        assert response.status_code == 200
+        assert User.objects.get(pk=user.pk).role == 'moderator', (
+            'Проверьте, что изменение профиля через `/api/v1/users/me/` '
+            'сохраняет только переданные поля и не перезаписывает роль '
+            'устаревшей копией пользователя.'
+        )
+
+    def test_07_evicted_version(self, user_client, user):
+        from api.authentication import get_user_cache, get_user_version_key
+        version_key = get_user_version_key(user.pk)
+        get_user_cache().delete(version_key)
+        assert user_client.get('/api/v1/users/').status_code == 403
+        user.role = 'admin'
+        user.save()
+        assert user_client.get('/api/v1/users/').status_code == 200
+        get_user_cache().delete(version_key)
+        assert user_client.get('/api/v1/users/').status_code == 200, (
+            'Проверьте, что после вытеснения номера версии из кеша '
+            'не возвращается устаревший кешированный пользователь.'
+        )
@@ -0,0 +1,122 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.utils import timezone
+
+
+class FailingBackend(EmailBackend):
+
+    def send_messages(self, messages):
+        raise ConnectionRefusedError('SMTP недоступен')
+
+
+class ClaimCheckingBackend(EmailBackend):
+    attempts = []
+
+    def send_messages(self, messages):
+        from reviews.models import OutgoingEmail
+        for message in messages:
+            email = OutgoingEmail.objects.get(recipient=message.to[0])
+            self.attempts.append(email.attempts)
+            if message.to[0].startswith('broken'):
+                raise ValueError('Некорректное письмо')
+        return super().send_messages(messages)
+
+
+def send_emails():
+    call_command('send_emails', stdout=StringIO())
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19EmailOutbox:
+    url_signup = '/api/v1/auth/signup/'
+    data = {'email': 'valid@yamdb.fake', 'username': 'valid_username'}
+
+    @pytest.fixture(autouse=True)
+    def outbox(self, settings):
+        settings.EMAIL_OUTBOX = True
+        settings.EMAIL_OUTBOX_MAX_ATTEMPTS = 2
+
+    def test_01_signup_enqueues(self, client):
+        from reviews.models import OutgoingEmail
+        response = client.post(self.url_signup, data=self.data)
+        assert response.status_code == 200
+        assert len(mail.outbox) == 0, (
+            'Проверьте, что при включённой очереди письмо с кодом '
+            'подтверждения не отправляется во время запроса.'
+        )
+        assert OutgoingEmail.objects.filter(
+            recipient=self.data['email'], sent_at=None
+        ).count() == 1, (
+            'Проверьте, что письмо с кодом подтверждения попадает в очередь.'
+        )
+        send_emails()
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == [self.data['email']]
+        assert OutgoingEmail.objects.get().sent_at is not None
+        send_emails()
+        assert len(mail.outbox) == 1, (
+            'Проверьте, что отправленное письмо не отправляется повторно.'
+        )
+
+    def test_02_retry_with_backoff(self, client, settings):
+        from reviews.models import OutgoingEmail
+        client.post(self.url_signup, data=self.data)
+        settings.EMAIL_BACKEND = 'tests.test_19_email_outbox.FailingBackend'
+        send_emails()
+        email = OutgoingEmail.objects.get()
+        assert email.sent_at is None
+        assert email.attempts == 1
+        assert 'SMTP' in email.last_error
+        assert email.send_after > timezone.now(), (
+            'Проверьте, что неудачная отправка откладывается.'
+        )
+        OutgoingEmail.objects.update(send_after=timezone.now())
+        send_emails()
+        email.refresh_from_db()
+        assert email.attempts == 2
+        OutgoingEmail.objects.update(
+            send_after=timezone.now() - timedelta(seconds=1)
+        )
+        settings.EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+        send_emails()
+        assert len(mail.outbox) == 0, (
+            'Проверьте, что после EMAIL_OUTBOX_MAX_ATTEMPTS попыток письмо '
+            'больше не отправляется.'
+        )
+        OutgoingEmail.objects.update(attempts=0)
+        send_emails()
+        assert len(mail.outbox) == 1
+
+    def test_03_claim_and_save_each(self, settings):
+        from reviews.models import OutgoingEmail
+        for recipient in ('broken@yamdb.fake', 'valid@yamdb.fake'):
+            OutgoingEmail.objects.create(
+                subject='Код', body='123', from_email='yamdb@yamdb.fake',
+                recipient=recipient
+            )
+        settings.EMAIL_BACKEND = (
+            'tests.test_19_email_outbox.ClaimCheckingBackend'
+        )
+        ClaimCheckingBackend.attempts = []
+        send_emails()
+        assert ClaimCheckingBackend.attempts == [1, 1], (
+            'Проверьте, что письмо помечается как взятое в отправку '
+            '(увеличивается `attempts`) до обращения к почтовому серверу.'
+        )
+        broken = OutgoingEmail.objects.get(recipient='broken@yamdb.fake')
+        assert broken.sent_at is None
+        assert 'Некорректное' in broken.last_error, (
+            'Проверьте, что любая ошибка отправки одного письма '
+            'сохраняется и не прерывает отправку остальных.'
+        )
+        assert OutgoingEmail.objects.get(
+            recipient='valid@yamdb.fake'
+        ).sent_at is not None
+        assert [message.to for message in mail.outbox] == [
+            ['valid@yamdb.fake']
+        ]
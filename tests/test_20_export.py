@@ -0,0 +1,95 @@
+import csv
+import json
+import os
+from io import StringIO
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+
+DATA_DIR = os.path.join(settings.BASE_DIR, 'static', 'data')
+TABLES = ('users', 'category', 'genre', 'titles', 'genre_title', 'review',
+          'comments')
+
+
+def read_csv(path):
+    with open(path, encoding='utf-8', newline='') as file:
+        return sorted(
+            (tuple(row.items()) for row in csv.DictReader(file)),
+            key=lambda row: int(row[0][1])
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20Export:
+
+    def test_01_permissions(self, client, user_client):
+        url = '/api/v1/export/titles/'
+        assert client.get(url).status_code == 401
+        assert user_client.get(url).status_code == 403, (
+            'Проверьте, что выгрузка доступна только администратору.'
+        )
+
+    def test_02_stream(self, admin_client):
+        call_command('import_csv', stdout=StringIO())
+        response = admin_client.get('/api/v1/export/review/')
+        assert response.status_code == 200
+        assert response.streaming, (
+            'Проверьте, что выгрузка отдаётся потоковым ответом.'
+        )
+        rows = [
+            json.loads(line) for line in
+            b''.join(response.streaming_content).decode().splitlines()
+        ]
+        assert [row['id'] for row in rows] == sorted(
+            row['id'] for row in rows
+        )
+        assert set(rows[0]) == {
+            'id', 'title_id', 'text', 'author', 'score', 'pub_date'
+        }
+        response = admin_client.get(
+            '/api/v1/export/titles/', {'output': 'csv'}
+        )
+        assert response['Content-Type'].startswith('text/csv')
+        header = b''.join(response.streaming_content).decode().split('\n')[0]
+        assert header == 'id,name,year,category,description'
+        assert admin_client.get('/api/v1/export/unknown/').status_code == 404
+        assert admin_client.get(
+            '/api/v1/export/titles/', {'output': 'xml'}
+        ).status_code == 400
+
+    def test_03_round_trip(self, tmp_path):
+        from reviews.models import Title
+        call_command('import_csv', stdout=StringIO())
+        ratings = list(Title.objects.order_by('pk').values_list(
+            'rating_sum', 'reviews_count'
+        ))
+        call_command('export_data', '--path', str(tmp_path), stdout=StringIO())
+        for table in TABLES:
+            expected = read_csv(os.path.join(DATA_DIR, f'{table}.csv'))
+            if table == 'titles':
+                expected = [row + (('description', ''),) for row in expected]
+            assert read_csv(tmp_path / f'{table}.csv') == expected, (
+                f'Проверьте, что выгрузка {table} совпадает по формату '
+                'с файлами static/data.'
+            )
+        call_command('flush', interactive=False, verbosity=0)
+        call_command('import_csv', '--path', str(tmp_path), stdout=StringIO())
+        assert list(Title.objects.order_by('pk').values_list(
+            'rating_sum', 'reviews_count'
+        )) == ratings
+
+    def test_04_description(self, tmp_path):
+        from reviews.models import Title
+        call_command('import_csv', stdout=StringIO())
+        Title.objects.filter(pk=1).update(description='Описание, "в кавычках"')
+        call_command('export_data', '--path', str(tmp_path), stdout=StringIO())
+        call_command('flush', interactive=False, verbosity=0)
+        call_command('import_csv', '--path', str(tmp_path), stdout=StringIO())
+        assert Title.objects.get(pk=1).description == (
+            'Описание, "в кавычках"'
+        ), (
+            'Проверьте, что описание произведения выгружается и загружается '
+            'обратно.'
+        )
+        assert Title.objects.get(pk=2).description is None
@@ -0,0 +1,127 @@
+import pytest
+
+from tests.utils import create_categories, create_genre
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21TitleBulk:
+    url = '/api/v1/titles/bulk/'
+
+    def payload(self, count, genres, categories):
+        return [
+            {
+                'name': f'Произведение {idx}',
+                'year': 2000,
+                'genre': [genre['slug'] for genre in genres],
+                'category': categories[idx % len(categories)]['slug'],
+            }
+            for idx in range(count)
+        ]
+
+    def test_01_permissions(self, client, user_client):
+        assert client.post(
+            self.url, data='[]', content_type='application/json'
+        ).status_code == 401
+        assert user_client.post(
+            self.url, data=[], format='json'
+        ).status_code == 403, (
+            'Проверьте, что массовое создание произведений доступно только '
+            'администратору.'
+        )
+
+    def test_02_bulk_create(self, admin_client, client):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        data = self.payload(3, genres, categories)
+        data.insert(1, {'name': 'Без года', 'genre': [], 'category': 'x'})
+        data.append({
+            'name': 'Неизвестный жанр',
+            'year': 2000,
+            'genre': [genres[0]['slug'], 'unknown'],
+            'category': categories[0]['slug'],
+        })
+        response = admin_client.post(self.url, data=data, format='json')
+        assert response.status_code == 201
+        result = response.json()
+        assert [item['name'] for item in result['created']] == [
+            'Произведение 0', 'Произведение 1', 'Произведение 2'
+        ], 'Проверьте, что корректные произведения создаются.'
+        assert [error['index'] for error in result['errors']] == [1, 4], (
+            'Проверьте, что ошибки возвращаются для каждого элемента '
+            'с его индексом, не прерывая создание остальных.'
+        )
+        assert 'year' in result['errors'][0]['errors']
+        assert list(result['errors'][1]['errors']) == ['genre']
+        title = result['created'][0]
+        detail = client.get(f'/api/v1/titles/{title["id"]}/').json()
+        assert sorted(item['slug'] for item in detail['genre']) == sorted(
+            title['genre']
+        )
+        assert detail['category']['slug'] == title['category']
+
+    @pytest.mark.parametrize('count', (2, 20))
+    def test_03_bulk_queries(self, admin_client, django_assert_num_queries,
+                             count):
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        admin_client.get('/api/v1/users/me/')
+        data = self.payload(count, genres, categories)
+        with django_assert_num_queries(6):
+            response = admin_client.post(self.url, data=data, format='json')
+        assert len(response.json()['created']) == count, (
+            'Проверьте, что число запросов массового создания не зависит '
+            'от количества произведений.'
+        )
+
+    def test_04_invalid_payload(self, admin_client, settings):
+        response = admin_client.post(
+            self.url, data={'name': 'x'}, format='json'
+        )
+        assert response.status_code == 400
+        settings.TITLE_BULK_MAX_SIZE = 1
+        response = admin_client.post(
+            self.url, data=[{}, {}], format='json'
+        )
+        assert response.status_code == 400
+
+    def test_05_ids_not_reused(self, admin_client):
+        from reviews.models import Title
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        created = admin_client.post(
+            self.url, data=self.payload(3, genres, categories), format='json'
+        ).json()['created']
+        Title.objects.filter(pk=created[-1]['id']).delete()
+        created_again = admin_client.post(
+            self.url, data=self.payload(2, genres, categories), format='json'
+        ).json()['created']
+        assert created_again[0]['id'] > created[-1]['id'], (
+            'Проверьте, что массовое создание не переиспользует '
+            'идентификаторы удалённых произведений.'
+        )
+        for title in created_again:
+            assert Title.objects.get(pk=title['id']).name == title['name']
+
+    @pytest.mark.parametrize('error', (
+        'IntegrityError', 'OperationalError'
+    ))
+    def test_06_write_conflict(self, admin_client, monkeypatch, settings,
+                               error):
+        from django import db
+
+        from reviews.models import Title
+        settings.SQLITE_LOCK_RETRIES = 0
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+
+        def fail(*args, **kwargs):
+            raise getattr(db, error)('database is locked')
+
+        monkeypatch.setattr(Title, 'bulk_create_with_genres', fail)
+        response = admin_client.post(
+            self.url, data=self.payload(2, genres, categories), format='json'
+        )
+        assert response.status_code == 409, (
+            'Проверьте, что конфликт параллельной записи при массовом '
+            'создании возвращает ответ со статусом 409, а не 500.'
+        )
@@ -0,0 +1,61 @@
+import pytest
+from django.db import IntegrityError, connection
+
+from tests.utils import create_title_reviews
+
+
+@pytest.mark.django_db
+class Test22Indexes:
+
+    @pytest.mark.skipif(
+        connection.vendor != 'sqlite', reason='План запроса SQLite'
+    )
+    def test_01_query_plans(self):
+        from reviews.models import Comment, Review, Title
+        plans = (
+            (Review.objects.filter(title_id=1)[:10], 'review_title_pub_date'),
+            (Comment.objects.filter(review_id=1)[:10],
+             'comment_review_pub_date'),
+            (Title.objects.filter(year=2000)[:10], 'title_year'),
+            (Title.objects.filter(category_id=1, year=2000)[:10],
+             'title_category_year'),
+        )
+        for queryset, index in plans:
+            plan = queryset.explain()
+            assert index in plan and 'TEMP B-TREE' not in plan, (
+                f'Проверьте, что запрос использует индекс {index} '
+                f'без дополнительной сортировки: {plan}'
+            )
+
+    def test_02_unique_title_genre(self):
+        from reviews.models import Genre, Title, TitleGenre
+        title = Title.objects.create(name='Произведение', year=2000)
+        genre = Genre.objects.create(name='Драма', slug='drama')
+        TitleGenre.objects.create(title=title, genre=genre)
+        with pytest.raises(IntegrityError):
+            TitleGenre.objects.create(title=title, genre=genre)
+
+    def test_03_default_ordering(self, django_user_model):
+        from reviews.models import Title
+        title = Title.objects.create(name='Произведение', year=2000)
+        ids = [
+            review.pk
+            for review in create_title_reviews(django_user_model, title, 3)
+        ]
+        assert list(title.reviews.values_list('pk', flat=True)) == ids[::-1], (
+            'Проверьте, что отзывы по умолчанию упорядочены от новых к старым.'
+        )
+
+    def test_04_no_redundant_review_index(self):
+        from reviews.models import Review
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, Review._meta.db_table
+            )
+        assert not [
+            name for name, constraint in constraints.items()
+            if constraint['index'] and constraint['columns'] == ['pub_date']
+        ], (
+            'Проверьте, что у отзывов нет отдельного индекса по `pub_date`: '
+            'выборки отзывов покрывает индекс review_title_pub_date.'
+        )
@@ -0,0 +1,84 @@
+from io import StringIO
+
+import pytest
+from django.core.cache import caches
+from django.core.management import call_command
+from rest_framework.test import APIRequestFactory
+
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23FastSerializers:
+
+    def get_urls(self, admin_client, admin, user_client, user,
+                 moderator_client, moderator):
+        from reviews.models import Review, Title
+        authors_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client,
+        }
+        _, reviews, titles = create_comments(admin_client, authors_map)
+        review = Review.objects.get(pk=reviews[0]['id'])
+        review.score = 6
+        review.save()
+        Title.objects.filter(pk=titles[1]['id']).update(description=None)
+        title_id = titles[0]['id']
+        return (
+            '/api/v1/titles/',
+            f'/api/v1/titles/{title_id}/',
+            f'/api/v1/titles/{title_id}/reviews/',
+            f'/api/v1/titles/{title_id}/reviews/{reviews[0]["id"]}/',
+            f'/api/v1/titles/{title_id}/reviews/{reviews[0]["id"]}/'
+            'comments/',
+        )
+
+    def test_01_identical_json(self, client, admin_client, admin,
+                               user_client, user, moderator_client,
+                               moderator, monkeypatch):
+        from api.views import CommentViewSet, ReviewViewSet, TitleViewSet
+        urls = self.get_urls(admin_client, admin, user_client, user,
+                             moderator_client, moderator)
+        fast = [client.get(url).content for url in urls]
+        for cache in caches.all():
+            cache.clear()
+        for viewset in (TitleViewSet, ReviewViewSet, CommentViewSet):
+            monkeypatch.setattr(viewset, 'fast_serializer_class', None)
+        for url, content in zip(urls, fast):
+            response = client.get(url)
+            assert response.status_code == 200
+            assert response.content == content, (
+                f'Проверьте, что быстрый сериализатор для `{url}` '
+                'возвращает тот же JSON, что и сериализатор DRF.'
+            )
+
+    @pytest.mark.parametrize('method', ('GET', 'HEAD'))
+    def test_02_fast_serializer_class(self, method):
+        from api.serializers import (CommentFastSerializer,
+                                     ReviewFastSerializer,
+                                     TitleReadFastSerializer)
+        from api.views import CommentViewSet, ReviewViewSet, TitleViewSet
+        request = APIRequestFactory().generic(method, '/')
+        for viewset, serializer_class in (
+            (TitleViewSet, TitleReadFastSerializer),
+            (ReviewViewSet, ReviewFastSerializer),
+            (CommentViewSet, CommentFastSerializer),
+        ):
+            view = viewset(action='list', request=request, format_kwarg=None)
+            assert view.get_serializer_class() is serializer_class, (
+                f'Проверьте, что {method}-запросы к `{viewset.__name__}` '
+                f'сериализуются через `{serializer_class.__name__}`.'
+            )
+
+    def test_03_benchmark(self, admin_client, admin, user_client, user,
+                          moderator_client, moderator):
+        self.get_urls(admin_client, admin, user_client, user,
+                      moderator_client, moderator)
+        out = StringIO()
+        call_command(
+            'benchmark_serializers', '--size', '10', '--repeat', '1',
+            stdout=out
+        )
+        for name in ('titles', 'reviews', 'comments'):
+            assert name in out.getvalue()
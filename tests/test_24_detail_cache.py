@@ -0,0 +1,77 @@
+from io import StringIO
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24DetailCache:
+
+    def test_01_cache_hit(self, admin_client, client, monkeypatch,
+                          django_assert_num_queries):
+        from api.serializers import TitleReadFastSerializer
+        titles, _, _ = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+        first = client.get(url)
+        assert first.status_code == 200
+
+        def fail(*args, **kwargs):
+            raise AssertionError('Сериализатор вызван при попадании в кеш')
+
+        monkeypatch.setattr(
+            TitleReadFastSerializer, 'to_representation', fail
+        )
+        with django_assert_num_queries(0):
+            response = client.get(url)
+        assert response.content == first.content, (
+            'Проверьте, что `/api/v1/titles/{title_id}/` отдаётся из кеша '
+            'без запросов к базе данных и сериализации.'
+        )
+        assert response['ETag'] == first['ETag']
+        with django_assert_num_queries(0):
+            response = client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        assert response.status_code == 304
+
+    def test_02_invalidation(self, admin_client, user_client, client):
+        titles, categories, genres = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+        client.get(url)
+        admin_client.patch(url, data={'name': 'Новое название'})
+        assert client.get(url).json()['name'] == 'Новое название', (
+            'Проверьте, что изменение произведения сбрасывает кеш.'
+        )
+        admin_client.patch(url, data={'genre': [genres[2]['slug']]})
+        assert [genre['slug'] for genre in client.get(url).json()['genre']] == [
+            genres[2]['slug']
+        ], 'Проверьте, что изменение жанров произведения сбрасывает кеш.'
+        create_single_review(user_client, titles[0]['id'], 'Отзыв', 7)
+        assert client.get(url).json()['rating'] == 7, (
+            'Проверьте, что новый отзыв сбрасывает кеш произведения.'
+        )
+        admin_client.delete(f'/api/v1/genres/{genres[2]["slug"]}/')
+        assert client.get(url).json()['genre'] == [], (
+            'Проверьте, что удаление жанра сбрасывает кеш произведения.'
+        )
+        category = client.get(url).json()['category']['slug']
+        admin_client.delete(f'/api/v1/categories/{category}/')
+        assert client.get(url).json()['category'] is None, (
+            'Проверьте, что удаление категории сбрасывает кеш произведения.'
+        )
+
+    def test_03_rebuild_ratings(self, admin_client, user_client, client):
+        from django.core.management import call_command
+
+        from reviews.models import Title
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'Отзыв', 7)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+        Title.objects.filter(pk=titles[0]['id']).update(
+            rating_sum=1, rating=1
+        )
+        assert client.get(url).json()['rating'] == 1
+        call_command('rebuild_ratings', stdout=StringIO())
+        assert client.get(url).json()['rating'] == 7, (
+            'Проверьте, что `rebuild_ratings` сбрасывает кеш исправленных '
+            'произведений.'
+        )
@@ -0,0 +1,71 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connections, router
+
+
+@pytest.fixture
+def replica(settings, tmp_path):
+    connections.databases['replica1'] = {
+        **connections.databases['default'],
+        'NAME': str(tmp_path / 'replica.sqlite3'),
+    }
+    settings.DATABASE_REPLICAS = ['replica1']
+    yield 'replica1'
+    connections['replica1'].close()
+    del connections['replica1']
+    del connections.databases['replica1']
+
+
+def sync_replica():
+    call_command('sync_replica', stdout=StringIO())
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25Replica:
+
+    def test_01_reads_from_replica(self, replica, admin_client, client):
+        from reviews.models import Title
+        assert not router.allow_migrate(replica, 'reviews'), (
+            'Проверьте, что миграции не применяются к репликам.'
+        )
+        Title.objects.create(name='Синхронизировано', year=2000)
+        sync_replica()
+        Title.objects.create(name='Только на основной', year=2000)
+        response = client.get('/api/v1/titles/')
+        assert [title['name'] for title in response.json()['results']] == [
+            'Синхронизировано'
+        ], 'Проверьте, что безопасные запросы к произведениям идут в реплику.'
+        assert Title.objects.count() == 2, (
+            'Проверьте, что запросы вне API по умолчанию идут '
+            'в основную базу.'
+        )
+
+    def test_02_read_your_writes(self, replica, user_client, client):
+        from reviews.models import Title
+        title = Title.objects.create(name='Произведение', year=2000)
+        sync_replica()
+        url = f'/api/v1/titles/{title.pk}/reviews/'
+        response = user_client.post(url, data={'text': 'Отзыв', 'score': 7})
+        assert response.status_code == 201
+        assert user_client.get(url).json()['count'] == 1, (
+            'Проверьте, что после записи чтения автора идут в основную базу.'
+        )
+        assert client.get(url).json()['count'] == 0, (
+            'Проверьте, что чтения других клиентов идут в реплику.'
+        )
+        sync_replica()
+        assert client.get(url).json()['count'] == 1
+
+    def test_03_sticky_window(self, replica, user_client, settings):
+        from reviews.models import Title
+        settings.REPLICA_STICKY_SECONDS = 0
+        title = Title.objects.create(name='Произведение', year=2000)
+        sync_replica()
+        url = f'/api/v1/titles/{title.pk}/reviews/'
+        user_client.post(url, data={'text': 'Отзыв', 'score': 7})
+        assert user_client.get(url).json()['count'] == 0, (
+            'Проверьте, что по окончании REPLICA_STICKY_SECONDS чтения '
+            'снова идут в реплику.'
+        )
@@ -0,0 +1,59 @@
+import pytest
+
+from tests.utils import create_title_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26ApproximateCount:
+    url = '/api/v1/titles/'
+
+    def create_titles(self, count):
+        from reviews.models import Title
+        for idx in range(count):
+            Title.objects.create(name=f'Произведение {idx}', year=2000)
+
+    def test_01_exact_below_limit(self, client):
+        self.create_titles(3)
+        data = client.get(self.url).json()
+        assert data['count'] == 3
+        assert data['count_approximate'] is False, (
+            'Проверьте, что ниже PAGINATION_EXACT_COUNT_LIMIT количество '
+            'считается точно.'
+        )
+
+    def test_02_cached_above_limit(self, client, settings):
+        settings.PAGINATION_EXACT_COUNT_LIMIT = 3
+        self.create_titles(5)
+        data = client.get(self.url).json()
+        assert (data['count'], data['count_approximate']) == (5, True), (
+            'Проверьте, что выше PAGINATION_EXACT_COUNT_LIMIT ответ '
+            'помечается флагом `count_approximate`.'
+        )
+        self.create_titles(2)
+        data = client.get(self.url).json()
+        assert data['count'] == 5, (
+            'Проверьте, что приблизительное количество берётся из кеша.'
+        )
+        assert len(data['results']) == 7, (
+            'Проверьте, что приблизительное количество не обрезает страницу.'
+        )
+        assert client.get(self.url, {'year': 1999}).json() == {
+            'count': 0,
+            'count_approximate': False,
+            'next': None,
+            'previous': None,
+            'results': [],
+        }
+
+    def test_03_reviews_counter(self, client, django_user_model, settings):
+        from reviews.models import Title
+        settings.PAGINATION_EXACT_COUNT_LIMIT = 2
+        title = Title.objects.create(name='Произведение', year=2000)
+        create_title_reviews(django_user_model, title, 3)
+        Title.objects.filter(pk=title.pk).update(reviews_count=40)
+        data = client.get(f'/api/v1/titles/{title.pk}/reviews/').json()
+        assert (data['count'], data['count_approximate']) == (40, True), (
+            'Проверьте, что количество отзывов выше порога берётся из '
+            'счётчика `reviews_count` произведения.'
+        )
+        assert len(data['results']) == 3
@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tests.conftest import MANAGE_PATH
+
+PRODUCTION_ENV = {
+    'DJANGO_ENV': 'production',
+    'DJANGO_SECRET_KEY': 'secret',
+    'DJANGO_ALLOWED_HOSTS': 'yamdb.example.com',
+    'DJANGO_CACHE_BACKEND': 'django.core.cache.backends.memcached.'
+                            'MemcachedCache',
+    'DJANGO_CACHE_LOCATION': '127.0.0.1:11211',
+}
+
+
+def load_settings(**env):
+    environ = {
+        name: value for name, value in os.environ.items()
+        if not name.startswith(('DJANGO_', 'DB_'))
+    }
+    environ.update(env)
+    return subprocess.run(
+        [
+            sys.executable, '-c',
+            'import api_yamdb.settings as s; '
+            'print(s.CACHES["default"]["BACKEND"])',
+        ],
+        cwd=MANAGE_PATH,
+        env=environ,
+        capture_output=True,
+        text=True
+    )
+
+
+class Test27ProductionSettings:
+
+    @pytest.mark.parametrize(
+        'name', (
+            'DJANGO_SECRET_KEY',
+            'DJANGO_ALLOWED_HOSTS',
+            'DJANGO_CACHE_BACKEND',
+            'DJANGO_CACHE_LOCATION',
+        )
+    )
+    def test_01_required_variables(self, name):
+        env = dict(PRODUCTION_ENV)
+        del env[name]
+        result = load_settings(**env)
+        assert result.returncode != 0 and name in result.stderr, (
+            f'Проверьте, что рабочий профиль не запускается без `{name}`.'
+        )
+
+    def test_02_shared_cache(self):
+        result = load_settings(**PRODUCTION_ENV)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == (
+            PRODUCTION_ENV['DJANGO_CACHE_BACKEND']
+        )
+
+    @pytest.mark.parametrize('backend', (
+        'django.core.cache.backends.locmem.LocMemCache',
+        'django.core.cache.backends.db.DatabaseCache',
+        'django.core.cache.backends.filebased.FileBasedCache',
+    ))
+    def test_02_unshared_cache(self, backend):
+        result = load_settings(
+            **dict(PRODUCTION_ENV, DJANGO_CACHE_BACKEND=backend)
+        )
+        assert result.returncode != 0, (
+            f'Проверьте, что рабочий профиль не запускается с `{backend}`: '
+            'нужен общий кеш в памяти.'
+        )
+
+    def test_03_development_defaults(self):
+        result = load_settings()
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == (
+            'django.core.cache.backends.locmem.LocMemCache'
+        )
+
+    def test_04_cache_table_on_primary(self):
+        from django.core.cache.backends.db import DatabaseCache
+
+        from reviews.db import ReplicaRouter, use_database
+        cache = DatabaseCache('yamdb_cache', {})
+        with use_database('replica1'):
+            assert ReplicaRouter().db_for_read(
+                cache.cache_model_class
+            ) == 'default', (
+                'Проверьте, что таблица `DatabaseCache` всегда читается из '
+                'основной БД.'
+            )
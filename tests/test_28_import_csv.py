@@ -0,0 +1,60 @@
+import csv
+import shutil
+from io import StringIO
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.db.models import Avg, Count
+
+
+def check_ratings():
+    from reviews.models import Title
+    for title in Title.objects.annotate(
+        average=Avg('reviews__score'), total=Count('reviews')
+    ):
+        assert (title.rating, title.reviews_count) == (
+            title.average, title.total
+        ), (
+            'Проверьте, что `import_csv` учитывает в рейтинге только '
+            'действительно сохранённые отзывы.'
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28ImportCsv:
+
+    def test_01_conflicting_user(self, django_user_model):
+        from reviews.models import Review
+        django_user_model.objects.create(
+            pk=5000, username='bingobongo', email='other@yamdb.fake'
+        )
+        out = StringIO()
+        call_command('import_csv', stdout=out)
+        assert 'users.csv: загружено' in out.getvalue()
+        assert not django_user_model.objects.filter(pk=100).exists()
+        assert not Review.objects.filter(author_id=100).exists(), (
+            'Проверьте, что строки, не вставленные из-за конфликта, '
+            'не считаются загруженными.'
+        )
+        check_ratings()
+
+    def test_02_duplicate_review(self, tmp_path):
+        from reviews.models import Review
+        data_dir = tmp_path / 'data'
+        shutil.copytree(settings.STATICFILES_DIRS[0] + 'data', data_dir)
+        with open(data_dir / 'review.csv', encoding='utf-8') as file:
+            rows = list(csv.DictReader(file))
+        with open(data_dir / 'review.csv', 'w', encoding='utf-8',
+                  newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+            writer.writerow(dict(rows[0], id='100000', score='1'))
+        out = StringIO()
+        call_command('import_csv', '--path', str(data_dir), stdout=out)
+        assert not Review.objects.filter(pk=100000).exists()
+        assert f'review.csv: загружено {len(rows)}, пропущено 1' in (
+            out.getvalue()
+        )
+        check_ratings()
@@ -163,6 +163,25 @@ def create_single_review(client, title_id, text, score):
     return response
 
 
+def create_authors(user_model, count):
+    return [
+        user_model.objects.create(
+            username=f'author{idx}', email=f'author{idx}@yamdb.fake'
+        )
+        for idx in range(count)
+    ]
+
+
+def create_title_reviews(user_model, title, count):
+    from reviews.models import Review
+    return [
+        Review.objects.create(
+            title=title, author=author, text=f'Отзыв {idx}', score=5
+        )
+        for idx, author in enumerate(create_authors(user_model, count))
+    ]
+
+
 def create_single_comment(client, title_id, review_id, text):
     data = {'text': text}
     response = client.post(